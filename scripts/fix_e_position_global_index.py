@@ -43,7 +43,7 @@ def fix_global_index(input_tsv: str, output_tsv: str):
     pref = num_ok_str.mask(num_ok_str.eq(""), other=lbl)
 
     # Build global label order using FIXED sort_key
-    uniq = sorted({p for p in pref if p not in ("", "nan")}, key=trnas_in_space.sort_key)
+    uniq = trnas_in_space.sort_labels({p for p in pref if p not in ("", "nan")})
     to_ord = {u: i + 1 for i, u in enumerate(uniq)}
 
     print(f"  Unique labels: {len(uniq)}")
@@ -19,6 +19,7 @@ import json
 import os
 import re
 import sys
+from functools import lru_cache
 from glob import glob
 
 import numpy as np
@@ -100,6 +101,13 @@ E_POSITION_ORDER_MAP = {label: idx for idx, label in enumerate(E_POSITION_BIOLOG
 # ------------------------- helpers: files -------------------------
 
 
+# Filename patterns for infer_trna_id_from_filename(), compiled once at import:
+# the "-B_His" style source suffix, and the anticodon after the amino acid
+# (which can include digits like Ile2 or lowercase like fMet/iMet)
+SOURCE_SUFFIX_RE = re.compile(r"^(.*?)-[A-Z]_[A-Za-z0-9]+$")
+NAME_ANTICODON_RE = re.compile(r"(tRNA-[A-Za-z0-9]+-)([ACGTU]{3})(-)", re.IGNORECASE)
+
+
 def infer_trna_id_from_filename(path: str) -> str:
     base = os.path.basename(path)
     name = base
@@ -107,7 +115,7 @@ def infer_trna_id_from_filename(path: str) -> str:
         if name.endswith(suf):
             name = name[: -len(suf)]
             break
-    m = re.match(r"^(.*?)-[A-Z]_[A-Za-z0-9]+$", name)  # strip "-B_His" style suffixes if present
+    m = SOURCE_SUFFIX_RE.match(name)  # strip "-B_His" style suffixes if present
     trna_id = m.group(1) if m else name
     # Convert DNA notation (T) to RNA notation (U) in anticodon portion
     # Anticodon is after amino acid: nuc-tRNA-Ala-TGC-1-1 -> nuc-tRNA-Ala-UGC-1-1
@@ -115,16 +123,27 @@ def infer_trna_id_from_filename(path: str) -> str:
     # Pattern: tRNA-<amino>-<anticodon>- where amino can include digits (Ile2) or lowercase (fMet, iMet)
     def replace_anticodon_t_with_u(match):
         return match.group(1) + match.group(2).replace("T", "U") + match.group(3)
-    trna_id = re.sub(r"(tRNA-[A-Za-z0-9]+-)([ACGTU]{3})(-)", replace_anticodon_t_with_u, trna_id, flags=re.IGNORECASE)
+
+    trna_id = NAME_ANTICODON_RE.sub(replace_anticodon_t_with_u, trna_id)
     return trna_id
 
 
+# tRNA ID patterns, compiled once at import (case-insensitive)
+MITO_ID_RE = re.compile(r"MITO-TRNA|^MITO-", re.IGNORECASE)
+# Everything excluded from nuclear coordinates by name: selenocysteine,
+# initiator Met (iMet/fMet/"initiator") and mitochondrial tRNAs
+NUCLEAR_EXCLUDE_ID_RE = re.compile(
+    r"SEC|SELENOCYSTEINE|IMET|INITIAT|FMET|" + MITO_ID_RE.pattern, re.IGNORECASE
+)
+# Extended variable arm (Type II) amino acids: Leu, Ser, Tyr
+TYPE2_ID_RE = re.compile(r"LEU|SER|TYR", re.IGNORECASE)
+
+
 def is_mitochondrial_trna(trna_id: str) -> bool:
     """Check if a tRNA is mitochondrial based on its ID."""
     if trna_id is None:
         return False
-    trna_id_upper = trna_id.upper()
-    return "MITO-TRNA" in trna_id_upper or trna_id_upper.startswith("MITO-")
+    return MITO_ID_RE.search(trna_id) is not None
 
 
 def get_label_offset_correction(trna_id: str) -> int:
@@ -188,34 +207,67 @@ def auto_fill_missing_labels(rows: list) -> list:
     """
     rows = sorted(rows, key=lambda r: r["seq_index"])
 
+    # Normalize each label once; numeric value for purely numeric labels
+    # (skips "20a", "e5"), None otherwise
+    labels = [str(r.get("sprinzl_label", "")).strip() for r in rows]
+    nums = [int(lbl) if lbl.isdecimal() else None for lbl in labels]
+
     for i in range(1, len(rows) - 1):
-        prev_label = str(rows[i - 1].get("sprinzl_label", "")).strip()
-        curr_label = str(rows[i].get("sprinzl_label", "")).strip()
-        next_label = str(rows[i + 1].get("sprinzl_label", "")).strip()
-
-        # Current is unlabeled, neighbors are labeled
-        curr_is_empty = not curr_label or curr_label == "nan"
-        prev_is_labeled = prev_label and prev_label != "nan"
-        next_is_labeled = next_label and next_label != "nan"
-
-        if curr_is_empty and prev_is_labeled and next_is_labeled:
-            try:
-                # Extract numeric part from labels (handles "5", but skips "20a", "e5")
-                if not prev_label.isdigit() or not next_label.isdigit():
-                    continue
-
-                prev_num = int(prev_label)
-                next_num = int(next_label)
-
-                # Difference of 2 means exactly 1 position is missing (e.g., 5->7 missing 6)
-                if next_num - prev_num == 2:
-                    rows[i]["sprinzl_label"] = str(prev_num + 1)
-            except (ValueError, TypeError):
-                pass
+        # Current is unlabeled, neighbors are numeric labels
+        if labels[i] and labels[i] != "nan":
+            continue
+        prev_num, next_num = nums[i - 1], nums[i + 1]
+        if prev_num is None or next_num is None:
+            continue
+
+        # Difference of 2 means exactly 1 position is missing (e.g., 5->7 missing 6)
+        if next_num - prev_num == 2:
+            rows[i]["sprinzl_label"] = str(prev_num + 1)
 
     return rows
 
 
+def infer_sprinzl_indices(vals) -> np.ndarray:
+    """
+    Fill missing sprinzl_index values (< 1) by monotone inference.
+
+    Each gap is extrapolated forward from the previous valid index and
+    backward from the next one. A gap is filled when both directions agree,
+    or when only one direction exists, and the result lies in 1..76;
+    otherwise it stays -1.
+
+    Args:
+        vals: sprinzl_index values in seq_index order
+
+    Returns:
+        int64 array of the same length
+    """
+    vals = np.asarray(vals, dtype=np.int64)
+    n = len(vals)
+    if n == 0:
+        return vals
+    pos = np.arange(n)
+    anchor = vals >= 1
+
+    # forward pass: last anchor at or before i, counted up to i
+    prev = np.maximum.accumulate(np.where(anchor, pos, -1))
+    has_fwd = prev >= 0
+    fwd = vals[np.maximum(prev, 0)] + (pos - prev)
+
+    # backward pass: next anchor at or after i, counted down to i
+    nxt = np.minimum.accumulate(np.where(anchor, pos, n)[::-1])[::-1]
+    has_bwd = nxt < n
+    bwd = vals[np.minimum(nxt, n - 1)] - (nxt - pos)
+
+    fwd_ok = has_fwd & (fwd >= 1) & (fwd <= 76)
+    bwd_ok = has_bwd & (bwd >= 1) & (bwd <= 76)
+    return np.select(
+        [anchor, fwd_ok & has_bwd & (fwd == bwd), fwd_ok & ~has_bwd, bwd_ok & ~has_fwd],
+        [vals, fwd, fwd, bwd],
+        default=-1,
+    )
+
+
 def should_exclude_trna(trna_id: str, include_mito: bool = False) -> bool:
     """
     Filter out structurally incompatible tRNAs that cannot be meaningfully aligned.
@@ -238,36 +290,18 @@ def should_exclude_trna(trna_id: str, include_mito: bool = False) -> bool:
     if trna_id is None:
         return False
 
-    trna_id_upper = trna_id.upper()
-    is_mito = is_mitochondrial_trna(trna_id)
-
     if include_mito:
         # Generating mitochondrial coordinates - only include mito tRNAs
-        if not is_mito:
+        if not is_mitochondrial_trna(trna_id):
             return True  # Exclude non-mito tRNAs
         # Check poorly annotated exclusion list (includes some mito tRNAs)
-        if trna_id in EXCLUDED_POORLY_ANNOTATED:
-            return True
-        return False
+        return trna_id in EXCLUDED_POORLY_ANNOTATED
     else:
-        # Generating nuclear coordinates - exclude mito tRNAs
-        # Check poorly annotated exclusion list first
+        # Generating nuclear coordinates - check poorly annotated exclusion
+        # list first, then SeC, mito and initiator Met names in one regex scan
         if trna_id in EXCLUDED_POORLY_ANNOTATED:
             return True
-
-        # Exclude selenocysteine - incompatible structure
-        if "SEC" in trna_id_upper or "SELENOCYSTEINE" in trna_id_upper:
-            return True
-
-        # Exclude mitochondrial tRNAs - different structural architecture
-        if is_mito:
-            return True
-
-        # Exclude initiator methionine tRNAs - different structural features
-        if "IMET" in trna_id_upper or "INITIAT" in trna_id_upper or "FMET" in trna_id_upper:
-            return True
-
-        return False
+        return NUCLEAR_EXCLUDE_ID_RE.search(trna_id) is not None
 
 
 def classify_trna_type(trna_id: str, include_mito: bool = False) -> str:
@@ -290,11 +324,9 @@ def classify_trna_type(trna_id: str, include_mito: bool = False) -> str:
     if trna_id is None:
         return "exclude"
 
-    trna_id_upper = trna_id.upper()
-
     # Type II: Extended variable arm tRNAs (Leu, Ser, Tyr)
     # These have e1-e24 positions in their extended variable arms
-    if any(amino_acid in trna_id_upper for amino_acid in ["LEU", "SER", "TYR"]):
+    if TYPE2_ID_RE.search(trna_id):
         return "type2"
 
     # Type I: All other nuclear elongator tRNAs
@@ -307,38 +339,59 @@ def classify_trna_type(trna_id: str, include_mito: bool = False) -> str:
 from typing import List, Optional
 
 
-def validate_no_global_index_collisions(df: pd.DataFrame):
+def find_global_index_collisions(df: pd.DataFrame) -> pd.DataFrame:
     """
-    Detect and report global_index collisions that would break coordinate alignment.
+    Return the labelled rows at global_index values shared by more than one
+    preferred label (empty if there are no collisions).
+
     Uses the preferred label (the one actually used for coordinates) rather than
     raw sprinzl_label to avoid false positives from R2DT template differences.
-    Exits with error if collisions are found.
+    The result is df's rows, in order, with an added pref_label column.
     """
     # Build preferred labels using the same logic as coordinate generation
     pref_labels = build_pref_label(df)
-    df_with_pref = df.copy()
-    df_with_pref["pref_label"] = pref_labels
+    labeled = df.assign(pref_label=pref_labels)
+    labeled = labeled[
+        labeled["global_index"].notna()
+        & labeled["pref_label"].notna()
+        & (labeled["pref_label"] != "")
+    ]
+
+    # Sort by (global_index, label code) and scan neighbours: a global_index
+    # whose run holds more than one label code maps multiple preferred labels
+    # -> collision. On valid input this sort-and-compare is all the work done.
+    gidx = labeled["global_index"].to_numpy(dtype=np.int64)
+    codes, _ = pd.factorize(labeled["pref_label"])
+    order = np.lexsort((codes, gidx))
+    gidx, codes = gidx[order], codes[order]
+    clash = (gidx[1:] == gidx[:-1]) & (codes[1:] != codes[:-1])
+    if not clash.any():
+        return labeled.iloc[:0]
+    return labeled[labeled["global_index"].isin(np.unique(gidx[1:][clash]))]
 
-    # Group by global_index and find any with multiple distinct preferred labels
-    collision_groups = []
-    for global_idx, group in df_with_pref.groupby("global_index"):
-        if pd.isna(global_idx):
-            continue
-        unique_pref_labels = group["pref_label"].unique()
-        unique_pref_labels = [lbl for lbl in unique_pref_labels if pd.notna(lbl) and lbl != ""]
-        if len(unique_pref_labels) > 1:
-            # Found collision: multiple preferred labels mapping to same global_index
-            collision_groups.append((global_idx, unique_pref_labels, group))
 
-    if collision_groups:
+def validate_no_global_index_collisions(df: pd.DataFrame):
+    """
+    Detect and report global_index collisions that would break coordinate alignment.
+    See find_global_index_collisions(). Exits with error if collisions are found.
+    """
+    collisions = find_global_index_collisions(df)
+
+    if not collisions.empty:
+        # One row per distinct (global_index, preferred label) at colliding indices
+        colliding = collisions.drop_duplicates(["global_index", "pref_label"])
+
+        # Example tRNAs per colliding (global_index, label), gathered in one pass
+        examples = collisions.groupby(["global_index", "pref_label"], sort=False)["trna_id"].unique()
+
         print("\n[ERROR] Global index collisions detected!")
         print(
             "Multiple structural positions share the same global_index, breaking coordinate alignment:\n"
         )
-        for global_idx, labels, group in collision_groups:
+        for global_idx, group in colliding.groupby("global_index"):
             print(f"  global_index {global_idx}:")
-            for label in labels:
-                trna_examples = group[group["pref_label"] == label]["trna_id"].unique()[:3]
+            for label in group["pref_label"]:
+                trna_examples = examples[(global_idx, label)][:3]
                 print(f"    - position '{label}' (examples: {', '.join(trna_examples)})")
             print()
 
@@ -423,45 +476,9 @@ def collect_rows_from_json(fp: str, include_mito: bool = False):
 
     # Fill missing sprinzl_index by monotone inference along seq_index
     rows.sort(key=lambda r: r["seq_index"])
-    n = len(rows)
-    vals = [r["sprinzl_index"] for r in rows]
-
-    # forward pass
-    fwd = [None] * n
-    last = None
-    for i in range(n):
-        v = vals[i]
-        if isinstance(v, int) and v >= 1:
-            fwd[i] = v
-            last = v
-        elif last is not None:
-            fwd[i] = last + 1
-            last += 1
-
-    # backward pass
-    bwd = [None] * n
-    nxt = None
-    for i in range(n - 1, -1, -1):
-        v = vals[i]
-        if isinstance(v, int) and v >= 1:
-            bwd[i] = v
-            nxt = v
-        elif nxt is not None:
-            bwd[i] = nxt - 1
-            nxt -= 1
-
-    for i, r in enumerate(rows):
-        v = vals[i]
-        if v >= 1:
-            r["sprinzl_index"] = v
-        elif fwd[i] is not None and bwd[i] is not None and fwd[i] == bwd[i] and 1 <= fwd[i] <= 76:
-            r["sprinzl_index"] = fwd[i]
-        elif fwd[i] is not None and 1 <= fwd[i] <= 76 and bwd[i] is None:
-            r["sprinzl_index"] = fwd[i]
-        elif bwd[i] is not None and 1 <= bwd[i] <= 76 and fwd[i] is None:
-            r["sprinzl_index"] = bwd[i]
-        else:
-            r["sprinzl_index"] = -1
+    inferred = infer_sprinzl_indices([r["sprinzl_index"] for r in rows])
+    for r, v in zip(rows, inferred.tolist()):
+        r["sprinzl_index"] = v
 
     # Apply label overrides for known R2DT labeling errors (manual fallback)
     if trna_id in LABEL_OVERRIDES:
@@ -478,6 +495,12 @@ def collect_rows_from_json(fp: str, include_mito: bool = False):
 
 # --------------- phase 2: label order & continuous ----------------
 
+# Sprinzl label shapes, compiled once and shared by the sort keys
+FLOAT_LABEL_RE = re.compile(r"(\d+)\.0")  # "1.0" (label read as float)
+E_LABEL_RE = re.compile(r"e(\d+)")  # extended variable arm, e.g. "e12"
+NUMERIC_LABEL_RE = re.compile(r"(\d+)([A-Za-z]+)?")  # "20", "20a"
+DOTTED_LABEL_RE = re.compile(r"(\d+)\.(\d+)")  # "9.1"
+
 
 def normalize_label(lbl: str) -> str:
     """
@@ -496,13 +519,14 @@ def normalize_label(lbl: str) -> str:
         return ""
 
     # Normalize float-formatted labels: "1.0" -> "1"
-    float_match = re.fullmatch(r"(\d+)\.0", s)
+    float_match = FLOAT_LABEL_RE.fullmatch(s)
     if float_match:
         return float_match.group(1)
 
     return s
 
 
+@lru_cache(maxsize=1024)
 def sort_key(lbl: str):
     """
     Order labels for unified coordinate system.
@@ -510,14 +534,15 @@ def sort_key(lbl: str):
     Sort order: 20 < 20A < 20B; dotted like 9.1; e-positions in biological hairpin order.
 
     Returns tuples where ALL third elements are strings to ensure type consistency
-    in Python 3 comparisons. Uses zero-padding for numeric values.
+    in Python 3 comparisons. Uses zero-padding for numeric values. Results are
+    cached, since only a few hundred distinct labels exist.
     """
     s = normalize_label(lbl)
     if s == "":
         return (10**9, 2, "")
 
     # Type II extended variable arm positions (e1-e27) - biological hairpin ordering
-    m = re.fullmatch(r"e(\d+)", s)
+    m = E_LABEL_RE.fullmatch(s)
     if m:
         e_label = s
         if e_label in E_POSITION_ORDER_MAP:
@@ -528,20 +553,87 @@ def sort_key(lbl: str):
             return (45, 3, s)
 
     # Standard numeric positions with optional letter suffixes
-    m = re.fullmatch(r"(\d+)([A-Za-z]+)?", s)
+    m = NUMERIC_LABEL_RE.fullmatch(s)
     if m:
         base = int(m.group(1))
         suf = (m.group(2) or "").upper()
         return (base, 1 if suf else 0, suf)
 
     # Dotted positions like 9.1 - convert to zero-padded string
-    m = re.fullmatch(r"(\d+)\.(\d+)", s)
+    m = DOTTED_LABEL_RE.fullmatch(s)
     if m:
         return (int(m.group(1)), 1, f"{int(m.group(2)):03d}")
 
     return (10**9 - 1, 2, s)
 
 
+def sort_keys(labels) -> pd.DataFrame:
+    """
+    Vectorized sort_key over many labels.
+
+    Returns a DataFrame with one row per label and columns major/minor/suffix
+    holding the same three key parts sort_key() returns as a tuple.
+    """
+    s = pd.Series(list(labels), dtype=object)
+    s = s.where(s.notna(), "").astype(str).str.strip()
+    s = s.where(s != "nan", "").str.replace(r"^(\d+)\.0$", r"\1", regex=True)
+
+    major = pd.Series(10**9 - 1, index=s.index, dtype=np.int64)
+    minor = pd.Series(2, index=s.index, dtype=np.int64)
+    suffix = s.copy()
+
+    # Dotted positions like 9.1
+    dotted = s.str.extract(r"^(\d+)\.(\d+)$")
+    is_dotted = dotted[0].notna()
+    major[is_dotted] = dotted.loc[is_dotted, 0].astype(np.int64)
+    minor[is_dotted] = 1
+    suffix[is_dotted] = dotted.loc[is_dotted, 1].astype(np.int64).map("{:03d}".format)
+
+    # Standard numeric positions with optional letter suffixes
+    numeric = s.str.extract(r"^(\d+)([A-Za-z]+)?$")
+    is_numeric = numeric[0].notna()
+    suf = numeric.loc[is_numeric, 1].fillna("").str.upper()
+    major[is_numeric] = numeric.loc[is_numeric, 0].astype(np.int64)
+    minor[is_numeric] = (suf != "").astype(np.int64)
+    suffix[is_numeric] = suf
+
+    # Type II extended variable arm positions - biological hairpin ordering
+    is_e = s.str.fullmatch(r"e\d+")
+    bio_order = s[is_e].map(E_POSITION_ORDER_MAP)
+    major[is_e] = 45
+    minor[is_e] = np.where(bio_order.notna(), 2, 3)
+    suffix.loc[is_e] = np.array(
+        [s_ if pd.isna(o) else f"{int(o):03d}" for s_, o in zip(s[is_e], bio_order)], dtype=object
+    )
+
+    is_empty = s == ""
+    major[is_empty] = 10**9
+    minor[is_empty] = 2
+    suffix[is_empty] = ""
+
+    return pd.DataFrame({"major": major, "minor": minor, "suffix": suffix})
+
+
+def sort_codes(labels) -> np.ndarray:
+    """
+    Pack sort_keys() into one int64 per label, ordered like sort_key().
+
+    The suffix is replaced by its rank among the distinct suffixes, so
+    (major, minor, suffix) collapses to (major * 4 + minor) * n_suffixes + rank.
+    """
+    keys = sort_keys(labels)
+    suffixes, rank = np.unique(keys["suffix"].to_numpy(dtype=str), return_inverse=True)
+    major_minor = keys["major"].to_numpy() * 4 + keys["minor"].to_numpy()
+    return major_minor * len(suffixes) + rank.reshape(-1)
+
+
+def sort_labels(labels) -> list:
+    """Sort labels in sort_key() order using one stable argsort over sort_codes()."""
+    labels = list(labels)
+    order = np.argsort(sort_codes(labels), kind="stable")
+    return [labels[i] for i in order]
+
+
 def sort_key_type1(lbl: str):
     """
     Sort key for Type I tRNAs: Standard 76nt tRNAs with simple variable arm.
@@ -554,19 +646,19 @@ def sort_key_type1(lbl: str):
         return (10**9, 2, "")
 
     # Standard numeric positions with optional letter suffixes
-    m = re.fullmatch(r"(\d+)([A-Za-z]+)?", s)
+    m = NUMERIC_LABEL_RE.fullmatch(s)
     if m:
         base = int(m.group(1))
         suf = (m.group(2) or "").upper()
         return (base, 1 if suf else 0, suf)
 
     # Allow dotted positions like 9.1 - zero-pad for string comparison
-    m = re.fullmatch(r"(\d+)\.(\d+)", s)
+    m = DOTTED_LABEL_RE.fullmatch(s)
     if m:
         return (int(m.group(1)), 1, f"{int(m.group(2)):03d}")
 
     # e-positions should not occur in Type I, but handle gracefully
-    m = re.fullmatch(r"e(\d+)", s)
+    m = E_LABEL_RE.fullmatch(s)
     if m:
         print(f"Warning: e-position {s} found in Type I tRNA (unexpected)")
         return (10**8, 2, f"{int(m.group(1)):03d}")
@@ -589,7 +681,7 @@ def sort_key_type2(lbl: str):
 
     # Type II extended variable arm positions (e1-e27) - biological hairpin ordering
     # Uses E_POSITION_ORDER_MAP to sort in 5'→3' order along the RNA backbone
-    m = re.fullmatch(r"e(\d+)", s)
+    m = E_LABEL_RE.fullmatch(s)
     if m:
         e_label = s  # e.g., "e1", "e12"
         if e_label in E_POSITION_ORDER_MAP:
@@ -603,14 +695,14 @@ def sort_key_type2(lbl: str):
             return (45, 3, s)
 
     # Standard numeric positions with optional letter suffixes
-    m = re.fullmatch(r"(\d+)([A-Za-z]+)?", s)
+    m = NUMERIC_LABEL_RE.fullmatch(s)
     if m:
         base = int(m.group(1))
         suf = (m.group(2) or "").upper()
         return (base, 1 if suf else 0, suf)
 
     # Allow dotted positions like 9.1 - convert to zero-padded string
-    m = re.fullmatch(r"(\d+)\.(\d+)", s)
+    m = DOTTED_LABEL_RE.fullmatch(s)
     if m:
         return (int(m.group(1)), 1, f"{int(m.group(2)):03d}")
 
@@ -639,7 +731,7 @@ def build_pref_label(df: pd.DataFrame) -> pd.Series:
 
 
 def build_global_label_order(pref: pd.Series):
-    uniq = sorted({p for p in pref if p not in ("", "nan")}, key=sort_key)
+    uniq = sort_labels({p for p in pref if p not in ("", "nan")})
     to_ord = {u: i + 1 for i, u in enumerate(uniq)}  # 1..K
     return uniq, to_ord
 
@@ -760,6 +852,18 @@ def sprinzl_numeric_from_label(label: str):
     return int(m.group(1)) if m else None
 
 
+def sprinzl_numeric_from_labels(labels) -> np.ndarray:
+    """
+    Vectorized sprinzl_numeric_from_label over many labels, as floats.
+
+    Labels repeat heavily, so each distinct label is parsed once; missing
+    labels and labels without a leading integer are NaN.
+    """
+    codes, uniq = pd.factorize(pd.Series(labels, dtype=object))
+    nums = np.array([sprinzl_numeric_from_label(u) for u in uniq] + [None], dtype=float)
+    return nums[codes]
+
+
 def assign_region_from_sprinzl(base_num: int) -> str:
     """
     Region buckets (Type I canonical; robust to insertions).
@@ -792,14 +896,58 @@ def assign_region_from_sprinzl(base_num: int) -> str:
     return "unknown"
 
 
+# assign_region_from_sprinzl() for every whole position 0..73; positions below
+# 1 are "unknown" and 73 and up are "acceptor-tail", so clipping covers the rest
+REGION_BY_POSITION = np.array([assign_region_from_sprinzl(p) for p in range(74)], dtype=object)
+
+
+def assign_regions_from_sprinzl(base_num) -> np.ndarray:
+    """
+    Vectorized assign_region_from_sprinzl over an array of positions.
+
+    Applies the same buckets in the same order; NaN positions are "unknown".
+    Whole-number positions (the usual case) are looked up in
+    REGION_BY_POSITION; fractional ones fall back to the range checks.
+    """
+    p = np.asarray(base_num, dtype=float)
+    pos = np.clip(np.nan_to_num(p, nan=0.0), 0, 73)
+    if (pos == np.floor(pos)).all():
+        return REGION_BY_POSITION[pos.astype(np.intp)]
+    conditions = [
+        ((1 <= p) & (p <= 7)) | ((66 <= p) & (p <= 72)),
+        p >= 73,
+        ((10 <= p) & (p <= 13)) | ((22 <= p) & (p <= 25)),
+        (14 <= p) & (p <= 21),
+        ((27 <= p) & (p <= 31)) | ((39 <= p) & (p <= 43)),
+        (32 <= p) & (p <= 38),
+        (44 <= p) & (p <= 46),
+        (46 < p) & (p < 49),
+        ((49 <= p) & (p <= 53)) | ((61 <= p) & (p <= 65)),
+        (54 <= p) & (p <= 60),
+    ]
+    choices = [
+        "acceptor-stem",
+        "acceptor-tail",
+        "D-stem",
+        "D-loop",
+        "anticodon-stem",
+        "anticodon-loop",
+        "variable-region",
+        "variable-arm",
+        "T-stem",
+        "T-loop",
+    ]
+    return np.select(conditions, choices, default="unknown").astype(object)
+
+
 def compute_region_column(df: pd.DataFrame) -> pd.Series:
     # prefer label’s numeric part; fall back to sprinzl_index (1..76)
-    base_from_label = df["sprinzl_label"].apply(sprinzl_numeric_from_label)
+    base_from_label = pd.Series(sprinzl_numeric_from_labels(df["sprinzl_label"]), index=df.index)
     idx_fallback = pd.to_numeric(df["sprinzl_index"], errors="coerce").where(
         lambda x: (x >= 1) & (x <= 76)
     )
     base_num = base_from_label.fillna(idx_fallback)
-    return base_num.apply(assign_region_from_sprinzl)
+    return pd.Series(assign_regions_from_sprinzl(base_num), index=df.index)
 
 
 # -------------------------------- main ---------------------------------
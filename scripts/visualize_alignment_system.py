@@ -11,11 +11,21 @@ Usage:
 Outputs PNG files to outputs/figures/
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
 import pandas as pd
 import numpy as np
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
-from matplotlib.colors import ListedColormap
+from matplotlib.collections import LineCollection, PatchCollection, PathCollection, PolyCollection
+from matplotlib.colors import to_rgba
+from matplotlib.font_manager import FontProperties
+from matplotlib.path import Path as MplPath
+from matplotlib.textpath import TextPath
+from matplotlib.transforms import Affine2D
 from pathlib import Path
 
 
@@ -39,6 +49,22 @@ NUCLEOTIDE_COLORS = {
     'T': OKABE_ITO['vermillion'], # vermillion/red
     'U': OKABE_ITO['vermillion'], # vermillion/red
 }
+UNKNOWN_COLOR = '#95a5a6'
+
+# ASCII-indexed RGBA lookup for residue colors (anything unrecognised -> grey)
+NUCLEOTIDE_COLOR_LUT = np.tile(to_rgba(UNKNOWN_COLOR), (128, 1))
+for _nuc, _color in NUCLEOTIDE_COLORS.items():
+    NUCLEOTIDE_COLOR_LUT[ord(_nuc)] = to_rgba(_color)
+
+# ASCII-indexed integer codes for the viz_02 heatmap (0 = gap/unknown)
+NUCLEOTIDE_CODE_LUT = np.zeros(128, dtype=np.uint8)
+for _nuc, _code in {'A': 1, 'C': 2, 'G': 3, 'T': 4, 'U': 4}.items():
+    NUCLEOTIDE_CODE_LUT[ord(_nuc)] = _code
+
+# uint8 RGBA per heatmap code: white for gaps, then A/C/G/T colors
+HEATMAP_PALETTE = np.array([to_rgba(c) for c in ['white', '#2ecc71', '#3498db', '#f39c12', '#e74c3c']])
+HEATMAP_PALETTE = np.round(HEATMAP_PALETTE * 255).astype(np.uint8)
+
 REGION_COLORS = {
     'acceptor-stem': '#e74c3c',
     'D-stem': '#9b59b6',
@@ -54,14 +80,182 @@ REGION_COLORS = {
 }
 
 
+# PNG output settings shared by every figure. zlib level 1 encodes several
+# times faster than the default level 6 for slightly larger files.
+SAVEFIG_KWARGS = {'dpi': 150, 'pil_kwargs': {'compress_level': 1}}
+
+CATEGORICAL_COLUMNS = ['trna_id', 'region', 'residue', 'sprinzl_label']
+INT32_COLUMNS = ['seq_index', 'global_index']
+
+
+def compact_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+    """Store repeated string columns as categoricals and index columns as int32."""
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in INT32_COLUMNS:
+        if col in df.columns and df[col].notna().all():
+            df[col] = df[col].astype(np.int32)
+    return df
+
+
 def load_data(filepath: str) -> pd.DataFrame:
-    """Load the global coordinates TSV file."""
+    """
+    Load the global coordinates TSV file.
+
+    A sidecar .parquet copy (with compact dtypes, see compact_dtypes) is written
+    next to the TSV and reused on later runs while it is at least as new as the
+    TSV. Parquet support is optional (needs pyarrow or fastparquet); without it
+    the TSV is parsed every time. An unreadable cache is ignored and rewritten;
+    the cache is written to a temporary file and renamed into place, so an
+    interrupted write never leaves a partial .parquet behind.
+    """
+    filepath = Path(filepath)
+    cache = filepath.with_suffix('.parquet')
+    if cache.exists() and cache.stat().st_mtime >= filepath.stat().st_mtime:
+        try:
+            return pd.read_parquet(cache)
+        except Exception:
+            pass  # No Parquet engine, or a corrupt cache: reparse and overwrite it
+
     df = pd.read_csv(filepath, sep='\t')
     # Convert empty strings to NaN for sprinzl_label
     df['sprinzl_label'] = df['sprinzl_label'].replace('', np.nan)
+    df = compact_dtypes(df)
+
+    tmp = cache.with_name(f'{cache.name}.{os.getpid()}.tmp')
+    try:
+        df.to_parquet(tmp, compression='zstd', index=False)
+        os.replace(tmp, cache)
+    except Exception:
+        tmp.unlink(missing_ok=True)  # Caching is best-effort
     return df
 
 
+@dataclass
+class AlignmentContext:
+    """Per-file lookups shared by every viz_* function, derived once from the table."""
+    df: pd.DataFrame
+    trna_ids: np.ndarray        # unique tRNA IDs in file order
+    n_trnas: int
+    max_global: int
+    region_by_gi: pd.Series     # global_index -> first non-null region
+    label_by_gi: pd.Series      # global_index -> first non-null sprinzl_label
+    present_by_trna: dict       # trna_id -> bool mask over 0..max_global
+    df_by_trna: pd.DataFrame    # df indexed (stably sorted) by trna_id
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame) -> 'AlignmentContext':
+        trna_ids = np.asarray(df['trna_id'].unique(), dtype=object)
+        max_global = int(df['global_index'].max())
+        region_by_gi = (df.dropna(subset=['region']).drop_duplicates('global_index')
+                        .set_index('global_index')['region'])
+        label_by_gi = (df.dropna(subset=['sprinzl_label']).drop_duplicates('global_index')
+                       .set_index('global_index')['sprinzl_label'])
+
+        placed = df.dropna(subset=['global_index'])
+        rows = pd.Categorical(placed['trna_id'], categories=trna_ids).codes
+        present = np.zeros((len(trna_ids), max_global + 1), dtype=bool)
+        present[rows, placed['global_index'].to_numpy(dtype=np.int64)] = True
+
+        df_by_trna = df.set_index('trna_id', drop=False).sort_index(kind='stable')
+        df_by_trna.index.name = None  # keep 'trna_id' unambiguous as a column
+
+        return cls(df=df, trna_ids=trna_ids, n_trnas=len(trna_ids), max_global=max_global,
+                   region_by_gi=region_by_gi, label_by_gi=label_by_gi,
+                   present_by_trna=dict(zip(trna_ids, present)), df_by_trna=df_by_trna)
+
+    def trna_rows(self, trna_ids) -> pd.DataFrame:
+        """
+        Rows for the given tRNA IDs via the sorted index instead of a full-column
+        scan. tRNAs come back in file order, as a df['trna_id'].isin() mask would.
+        """
+        wanted = self.trna_ids[np.isin(self.trna_ids, np.asarray(trna_ids, dtype=object))]
+        return self.df_by_trna.loc[list(wanted)].reset_index(drop=True)
+
+
+def residue_ascii_codes(residues) -> np.ndarray:
+    """
+    Return ASCII codes (0 for missing/non-ASCII) for an array of residues.
+
+    Works on any shape; used to index the NUCLEOTIDE_*_LUT tables.
+    """
+    arr = np.asarray(residues, dtype=object)
+    arr = np.where(pd.isna(arr), '', arr).astype('U1')
+    codes = arr.view(np.uint32).reshape(arr.shape)
+    return np.where(codes < 128, codes, 0)
+
+
+def residue_codes(residues: pd.Series) -> np.ndarray:
+    """
+    Return NUCLEOTIDE_CODE_LUT codes (0 = gap/unknown) for a residue Series.
+
+    Categorical residues (as produced by load_data) are encoded by looking up
+    each category once and indexing with the int8 category codes.
+    """
+    if isinstance(residues.dtype, pd.CategoricalDtype):
+        category_codes = NUCLEOTIDE_CODE_LUT[residue_ascii_codes(residues.cat.categories)]
+        category_codes = np.append(category_codes, 0)  # code -1 (missing) -> gap
+        return category_codes[residues.cat.codes.to_numpy()]
+    return NUCLEOTIDE_CODE_LUT[residue_ascii_codes(residues)]
+
+
+def residue_colors(residues) -> np.ndarray:
+    """Return an (N, 4) RGBA array for a sequence of single-letter residues."""
+    return NUCLEOTIDE_COLOR_LUT[residue_ascii_codes(residues)]
+
+
+def downsample_codes(codes: np.ndarray, resolution: int, n_values: int = 5) -> np.ndarray:
+    """
+    Reduce a (rows, cols) array of small integer codes to at most `resolution`
+    columns, keeping the most frequent code in each block of columns.
+
+    Code 0 is the gap: it wins a block only when strictly more frequent than
+    every nucleotide code, so a tie with a residue never blanks the block out.
+    Ties between nucleotide codes go to the lowest code.
+    """
+    step = -(-codes.shape[1] // resolution)  # ceil division
+    if step <= 1:
+        return codes
+    onehot = (codes[..., None] == np.arange(n_values)).astype(np.int32)
+    counts = np.add.reduceat(onehot, np.arange(0, codes.shape[1], step), axis=1)
+    score = counts * 2
+    score[..., 0] -= 1  # Gap loses ties
+    return score.argmax(axis=-1).astype(codes.dtype)
+
+
+@lru_cache(maxsize=None)
+def _glyph_path(text: str, fontsize: float, fontweight: str = 'normal') -> MplPath:
+    """Outline of a monospace string in points, centered on the origin."""
+    prop = FontProperties(family='monospace', weight=fontweight)
+    path = TextPath((0, 0), text, size=fontsize, prop=prop)
+    extents = path.get_extents()
+    if extents.width == 0 and extents.height == 0:
+        return path
+    return path.transformed(Affine2D().translate(-extents.x0 - extents.width / 2,
+                                                 -extents.y0 - extents.height / 2))
+
+
+def add_glyphs(ax, xs, ys, texts, colors, fontsize: float, fontweight: str = 'normal'):
+    """
+    Draw many short centered strings as a single PathCollection.
+
+    Each distinct string is shaped once (see _glyph_path) and then placed at
+    every (x, y) in data coordinates, which is far cheaper than one Text
+    artist per cell.
+    """
+    if len(texts) == 0:
+        return None
+    paths = [_glyph_path(t, fontsize, fontweight) for t in texts]
+    glyphs = PathCollection(paths, offsets=np.column_stack([xs, ys]),
+                            offset_transform=ax.transData,
+                            facecolors=colors, edgecolors='none')
+    # Glyph outlines are in points; scale to device pixels at draw time
+    glyphs.set_transform(Affine2D().scale(1 / 72) + ax.figure.dpi_scale_trans)
+    ax.add_collection(glyphs, autolim=False)
+    return glyphs
+
+
 def classify_label(label: str) -> str:
     """Classify a Sprinzl label by type."""
     if pd.isna(label) or label == '':
@@ -76,19 +270,31 @@ def classify_label(label: str) -> str:
     return 'standard'
 
 
-def viz_01_label_mapping(df: pd.DataFrame, output_dir: Path):
+def classify_labels(labels: pd.Series) -> np.ndarray:
+    """Vectorized classify_label for a whole Series of Sprinzl labels."""
+    s = pd.Series(labels).astype('string')
+    is_unlabeled = (s.isna() | (s == '')).fillna(True).to_numpy(dtype=bool)
+    is_e = s.str.startswith('e').fillna(False).to_numpy(dtype=bool)
+    is_insertion = s.str.contains(r'^\d.*[^\W\d_]', regex=True).fillna(False).to_numpy(dtype=bool)
+    return np.select([is_unlabeled, is_e, is_insertion],
+                     ['unlabeled', 'e-position', 'insertion'], default='standard')
+
+
+def viz_01_label_mapping(ctx: AlignmentContext, output_dir: Path):
     """
     Visualization 1: Label-to-Coordinate Mapping
     Shows how Sprinzl labels map to global_index coordinates.
     """
+    df = ctx.df
+
     # Get unique label-to-index mappings
-    label_map = df[df['sprinzl_label'].notna()].groupby('sprinzl_label').agg({
-        'global_index': 'first',
-        'region': 'first'
-    }).reset_index()
+    label_map = (df[df['sprinzl_label'].notna()]
+                 .drop_duplicates('sprinzl_label')[['sprinzl_label', 'global_index', 'region']]
+                 .sort_values('sprinzl_label')
+                 .reset_index(drop=True))
 
     # Classify each label
-    label_map['label_type'] = label_map['sprinzl_label'].apply(classify_label)
+    label_map['label_type'] = classify_labels(label_map['sprinzl_label'])
 
     # Sort by global_index
     label_map = label_map.sort_values('global_index')
@@ -101,7 +307,7 @@ def viz_01_label_mapping(df: pd.DataFrame, output_dir: Path):
         'unlabeled': '#95a5a6'
     }
 
-    fig, ax = plt.subplots(figsize=(16, 10))
+    fig, ax = plt.subplots(figsize=(16, 10), layout='constrained')
 
     # Plot each label
     colors = [type_colors[t] for t in label_map['label_type']]
@@ -109,18 +315,22 @@ def viz_01_label_mapping(df: pd.DataFrame, output_dir: Path):
                c=colors, s=50, alpha=0.7)
 
     # Add label text
-    for i, (_, row) in enumerate(label_map.iterrows()):
-        ax.annotate(row['sprinzl_label'],
-                   (row['global_index'], i),
+    for i, (label, gi) in enumerate(zip(label_map['sprinzl_label'].to_numpy(),
+                                        label_map['global_index'].to_numpy())):
+        ax.annotate(label,
+                   (gi, i),
                    xytext=(5, 0), textcoords='offset points',
                    fontsize=7, alpha=0.8)
 
     # Highlight gaps in global_index
-    all_indices = set(range(1, int(df['global_index'].max()) + 1))
-    used_indices = set(label_map['global_index'].astype(int))
-    gaps = sorted(all_indices - used_indices)
-    for gap in gaps:
-        ax.axvline(gap, color='red', alpha=0.1, linewidth=1)
+    present = np.zeros(ctx.max_global + 1, dtype=bool)
+    present[label_map['global_index'].to_numpy(dtype=np.int64)] = True
+    gaps = np.flatnonzero(~present)[1:]  # drop slot 0 (global_index is 1-based)
+    # One collection instead of an axvline artist per gap (x in data, y in axes coords)
+    gap_lines = LineCollection([[(gap, 0), (gap, 1)] for gap in gaps],
+                               colors='red', alpha=0.1, linewidths=1,
+                               transform=ax.get_xaxis_transform())
+    ax.add_collection(gap_lines, autolim=False)
 
     ax.set_xlabel('Global Index', fontsize=12)
     ax.set_ylabel('Sprinzl Labels (sorted by global_index)', fontsize=12)
@@ -134,99 +344,111 @@ def viz_01_label_mapping(df: pd.DataFrame, output_dir: Path):
     ax.set_yticks([])
     ax.grid(axis='x', alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / '01_label_to_coord_mapping.png', dpi=150, bbox_inches='tight')
+    plt.savefig(output_dir / '01_label_to_coord_mapping.png', **SAVEFIG_KWARGS)
     plt.close()
     print(f"Saved: {output_dir / '01_label_to_coord_mapping.png'}")
 
 
-def viz_02_heatmap(df: pd.DataFrame, output_dir: Path):
+def viz_02_heatmap(ctx: AlignmentContext, output_dir: Path, resolution: int = 2048):
     """
     Visualization 2: Cross-tRNA Alignment Heatmap
     Shows multiple tRNAs aligned by global_index.
+
+    Alignments wider than `resolution` columns are drawn from a block-wise
+    majority preview (see downsample_codes); axes stay in full column units.
     """
     # Get unique tRNAs and select a sample
-    trna_ids = df['trna_id'].unique()
     # Take first 25 or all if fewer
-    sample_trnas = trna_ids[:25]
+    sample_trnas = ctx.trna_ids[:25]
 
-    df_sample = df[df['trna_id'].isin(sample_trnas)]
+    df_sample = ctx.trna_rows(sample_trnas)
 
-    # Create pivot table
-    alignment = df_sample.pivot_table(
-        index='trna_id',
-        columns='global_index',
-        values='residue',
-        aggfunc='first'
-    )
+    # tRNA x global_index residue matrix: reindex onto the full (row, column)
+    # product and reshape, rather than pivoting (rows/columns sorted as pivot did)
+    row_ids = np.sort(sample_trnas)
+    col_ids = np.sort(df_sample['global_index'].dropna().unique())
+    cells = df_sample.drop_duplicates(['trna_id', 'global_index'])
 
-    # Encode nucleotides as numbers
-    nuc_to_num = {'A': 1, 'C': 2, 'G': 3, 'T': 4, 'U': 4}
-    alignment_numeric = alignment.map(lambda x: nuc_to_num.get(x, 0) if pd.notna(x) else 0)
+    # Encode nucleotides as numbers (A=1, C=2, G=3, T/U=4, gap=0) before the
+    # reshape so the reindex works on small integers rather than objects
+    codes = pd.Series(residue_codes(cells['residue']),
+                      index=pd.MultiIndex.from_frame(cells[['trna_id', 'global_index']]))
+    full_index = pd.MultiIndex.from_product([row_ids, col_ids],
+                                            names=['trna_id', 'global_index'])
+    alignment_numeric = (codes.reindex(full_index, fill_value=0).to_numpy(dtype=np.uint8)
+                         .reshape(len(row_ids), len(col_ids)))
 
     # Create figure
-    fig, ax = plt.subplots(figsize=(20, 8))
-
-    # Custom colormap: white for gaps, then A/C/G/T colors
-    cmap = ListedColormap(['white', '#2ecc71', '#3498db', '#f39c12', '#e74c3c'])
+    fig, ax = plt.subplots(figsize=(20, 8), layout='constrained')
 
-    im = ax.imshow(alignment_numeric.values, aspect='auto', cmap=cmap, vmin=0, vmax=4)
+    # Color the codes through a uint8 RGBA palette so imshow skips norm + colormap
+    n_rows, n_cols = alignment_numeric.shape
+    rgba = HEATMAP_PALETTE[downsample_codes(alignment_numeric, resolution)]
+    ax.imshow(rgba, aspect='auto', interpolation='nearest',
+              extent=(-0.5, n_cols - 0.5, n_rows - 0.5, -0.5))
 
     # Labels
-    ax.set_yticks(range(len(alignment.index)))
-    ax.set_yticklabels([tid.replace('nuc-tRNA-', '') for tid in alignment.index], fontsize=6)
+    ax.set_yticks(range(len(row_ids)))
+    ax.set_yticklabels([tid.replace('nuc-tRNA-', '') for tid in row_ids], fontsize=6)
 
     # X-axis: show every 10th position
-    xticks = range(0, len(alignment.columns), 10)
+    xticks = range(0, len(col_ids), 10)
     ax.set_xticks(xticks)
-    ax.set_xticklabels([alignment.columns[i] for i in xticks], fontsize=8)
+    ax.set_xticklabels([col_ids[i] for i in xticks], fontsize=8)
 
     ax.set_xlabel('Global Index', fontsize=12)
     ax.set_ylabel('tRNA', fontsize=12)
     ax.set_title('S. cerevisiae Type II tRNAs: Aligned by Global Coordinate\n'
                  'Green=A, Blue=C, Orange=G, Red=T/U, White=gap', fontsize=12)
 
-    # Add region annotations at top
-    region_map = df.groupby('global_index')['region'].first()
-    prev_region = None
-    region_starts = []
-    for i, col in enumerate(alignment.columns):
-        region = region_map.get(col, 'unknown')
-        if region != prev_region:
-            region_starts.append((i, region))
-            prev_region = region
-
-    # Draw region bars
-    for i, (start, region) in enumerate(region_starts):
-        end = region_starts[i+1][0] if i < len(region_starts)-1 else len(alignment.columns)
-        color = REGION_COLORS.get(region, '#95a5a6')
-        ax.axvspan(start-0.5, end-0.5, ymin=1.0, ymax=1.05,
-                   color=color, alpha=0.7, clip_on=False)
-
-    plt.tight_layout()
-    plt.savefig(output_dir / '02_alignment_heatmap.png', dpi=150, bbox_inches='tight')
+    # Add region annotations at top: one ribbon per run of equal regions.
+    # Look columns up in the sorted region table with searchsorted and find
+    # runs on integer region codes (-1 = unknown) rather than strings.
+    region_lut = ctx.region_by_gi.sort_index()
+    region_codes, region_names = pd.factorize(region_lut.astype(object))
+    # A trailing sentinel absorbs columns past the last known global_index
+    known_gi = np.append(region_lut.index.to_numpy(), -1)
+    region_codes = np.append(region_codes, -1)
+    pos = np.searchsorted(known_gi[:-1], col_ids)
+    col_codes = np.where(known_gi[pos] == col_ids, region_codes[pos], -1)
+    starts = np.r_[0, np.flatnonzero(col_codes[1:] != col_codes[:-1]) + 1]
+    ends = np.r_[starts[1:], len(col_ids)]
+    regions = np.append(np.asarray(region_names, dtype=object), 'unknown')[col_codes]
+
+    # Draw region bars as one collection (x in data, y in axes coordinates)
+    x0, x1 = starts - 0.5, ends - 0.5
+    verts = np.stack([np.column_stack([x0, np.full_like(x0, 1.0)]),
+                      np.column_stack([x1, np.full_like(x0, 1.0)]),
+                      np.column_stack([x1, np.full_like(x0, 1.05)]),
+                      np.column_stack([x0, np.full_like(x0, 1.05)])], axis=1)
+    region_colors = pd.Series(regions[starts]).map(REGION_COLORS).fillna(UNKNOWN_COLOR)
+    ax.add_collection(PolyCollection(verts, facecolors=region_colors.to_numpy(), edgecolor='none',
+                                     alpha=0.7, clip_on=False,
+                                     transform=ax.get_xaxis_transform()),
+                      autolim=False)
+
+    plt.savefig(output_dir / '02_alignment_heatmap.png', **SAVEFIG_KWARGS)
     plt.close()
     print(f"Saved: {output_dir / '02_alignment_heatmap.png'}")
 
 
-def viz_03_coverage(df: pd.DataFrame, output_dir: Path):
+def viz_03_coverage(ctx: AlignmentContext, output_dir: Path):
     """
     Visualization 3: Position Coverage
     Shows which positions are present in how many tRNAs.
     """
-    n_trnas = df['trna_id'].nunique()
+    n_trnas = ctx.n_trnas
 
-    # Count tRNAs at each position
-    coverage = df.groupby('global_index').agg({
-        'trna_id': 'nunique',
-        'region': 'first'
-    }).reset_index()
-    coverage.columns = ['global_index', 'count', 'region']
+    # Count tRNAs at each position from the per-tRNA presence masks
+    counts = np.sum(list(ctx.present_by_trna.values()), axis=0)
+    covered = np.flatnonzero(counts)
+    coverage = pd.DataFrame({'global_index': covered, 'count': counts[covered]})
+    coverage['region'] = coverage['global_index'].map(ctx.region_by_gi)
 
-    fig, ax = plt.subplots(figsize=(16, 6))
+    fig, ax = plt.subplots(figsize=(16, 6), layout='constrained')
 
     # Color bars by region
-    colors = [REGION_COLORS.get(r, '#95a5a6') for r in coverage['region']]
+    colors = coverage['region'].astype(object).map(REGION_COLORS).fillna(UNKNOWN_COLOR).to_numpy()
 
     ax.bar(coverage['global_index'], coverage['count'], color=colors, width=1.0, alpha=0.8)
 
@@ -248,19 +470,18 @@ def viz_03_coverage(df: pd.DataFrame, output_dir: Path):
     ax.set_xlim(0, coverage['global_index'].max() + 1)
     ax.grid(axis='y', alpha=0.3)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / '03_position_coverage.png', dpi=150, bbox_inches='tight')
+    plt.savefig(output_dir / '03_position_coverage.png', **SAVEFIG_KWARGS)
     plt.close()
     print(f"Saved: {output_dir / '03_position_coverage.png'}")
 
 
-def viz_04_ruler_tracks(df: pd.DataFrame, output_dir: Path):
+def viz_04_ruler_tracks(ctx: AlignmentContext, output_dir: Path):
     """
     Visualization 4: Ruler/Tracks View
     Shows horizontal tracks comparing several tRNAs.
     """
     # Select 4 different tRNAs (try to get Leu, Ser, Tyr)
-    trna_ids = df['trna_id'].unique()
+    trna_ids = ctx.trna_ids
     sample_trnas = []
     for aa in ['Leu', 'Ser', 'Tyr']:
         matches = [t for t in trna_ids if aa in t]
@@ -276,44 +497,43 @@ def viz_04_ruler_tracks(df: pd.DataFrame, output_dir: Path):
     sample_trnas = sample_trnas[:4]
 
     fig, axes = plt.subplots(len(sample_trnas), 1, figsize=(18, 3*len(sample_trnas)),
-                              sharex=True)
+                              sharex=True, layout='constrained')
     if len(sample_trnas) == 1:
         axes = [axes]
 
-    max_global = int(df['global_index'].max())
+    max_global = ctx.max_global
 
     for ax, trna_id in zip(axes, sample_trnas):
-        trna_df = df[df['trna_id'] == trna_id].sort_values('global_index')
+        trna_df = ctx.trna_rows([trna_id]).sort_values('global_index')
 
-        # Plot each position as a colored box
-        for _, row in trna_df.iterrows():
-            gi = row['global_index']
-            residue = row['residue']
-            label = row['sprinzl_label'] if pd.notna(row['sprinzl_label']) else '?'
-            region = row['region']
+        # Box color by nucleotide, label color by label type (one pass per tRNA)
+        box_colors = residue_colors(trna_df['residue'])
+        label_colors = pd.Series(classify_labels(trna_df['sprinzl_label'])).map(
+            {'insertion': 'red', 'e-position': 'green'}).fillna('black')
 
-            # Box color by nucleotide
-            color = NUCLEOTIDE_COLORS.get(residue, '#95a5a6')
+        # Plot each position as a colored box (one collection per track)
+        xs = trna_df['global_index'].to_numpy(dtype=float)
+        boxes = [mpatches.Rectangle((x-0.4, 0.2), 0.8, 0.6) for x in xs]
+        ax.add_collection(PatchCollection(boxes, facecolor=box_colors, edgecolor='black',
+                                          linewidth=0.5))
 
-            # Draw box
-            rect = mpatches.Rectangle((gi-0.4, 0.2), 0.8, 0.6,
-                                       facecolor=color, edgecolor='black', linewidth=0.5)
-            ax.add_patch(rect)
+        residues = trna_df['residue'].to_numpy()
+        labels = trna_df['sprinzl_label'].astype(object).fillna('?').astype(str).to_numpy()
 
+        for gi, residue, label, label_color in zip(xs, residues, labels, label_colors):
             # Add residue letter
             ax.text(gi, 0.5, residue, ha='center', va='center', fontsize=7, fontweight='bold')
 
             # Add Sprinzl label above
-            label_type = classify_label(label)
-            label_color = 'red' if label_type == 'insertion' else 'green' if label_type == 'e-position' else 'black'
-            ax.text(gi, 1.0, str(label), ha='center', va='bottom', fontsize=5,
+            ax.text(gi, 1.0, label, ha='center', va='bottom', fontsize=5,
                    rotation=90, color=label_color)
 
         # Highlight gaps
-        present_indices = set(trna_df['global_index'].astype(int))
-        for gi in range(1, max_global + 1):
-            if gi not in present_indices:
-                ax.axvspan(gi-0.4, gi+0.4, color='lightgray', alpha=0.3)
+        gap_spans = [mpatches.Rectangle((gi-0.4, 0), 0.8, 1)
+                     for gi in np.flatnonzero(~ctx.present_by_trna[trna_id])[1:]]
+        ax.add_collection(PatchCollection(gap_spans, facecolor='lightgray', edgecolor='none',
+                                          alpha=0.3, transform=ax.get_xaxis_transform()),
+                          autolim=False)
 
         ax.set_xlim(0, max_global + 1)
         ax.set_ylim(0, 1.8)
@@ -325,24 +545,21 @@ def viz_04_ruler_tracks(df: pd.DataFrame, output_dir: Path):
     axes[-1].set_xlabel('Global Index', fontsize=12)
     fig.suptitle('S. cerevisiae Type II tRNAs: Track Comparison\n'
                  'Labels above: black=standard, red=insertion, green=e-position',
-                 fontsize=12, y=1.02)
+                 fontsize=12)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / '04_ruler_tracks.png', dpi=150, bbox_inches='tight')
+    plt.savefig(output_dir / '04_ruler_tracks.png', **SAVEFIG_KWARGS)
     plt.close()
     print(f"Saved: {output_dir / '04_ruler_tracks.png'}")
 
 
-def viz_05_arrow_schematic(df: pd.DataFrame, output_dir: Path):
+def viz_05_arrow_schematic(ctx: AlignmentContext, output_dir: Path):
     """
     Visualization 5: Arrow Schematic
     Shows coordinate transformation with arrows for one tRNA.
     """
     # Pick one tRNA with interesting features
-    trna_id = df['trna_id'].iloc[0]
-    trna_df = df[df['trna_id'] == trna_id].sort_values('seq_index')
-
-    fig, ax = plt.subplots(figsize=(20, 8))
+    trna_id = ctx.trna_ids[0]
+    trna_df = ctx.trna_rows([trna_id]).sort_values('seq_index')
 
     # Two rows: top = seq_index, bottom = global_index
     top_y = 2
@@ -351,46 +568,57 @@ def viz_05_arrow_schematic(df: pd.DataFrame, output_dir: Path):
     # Scale factor for x positions
     scale = 1.0
 
-    # Draw top row (sequence positions)
-    for _, row in trna_df.iterrows():
-        si = row['seq_index'] * scale
-        gi = row['global_index'] * scale
-        residue = row['residue']
-        label = row['sprinzl_label'] if pd.notna(row['sprinzl_label']) else '?'
-
-        color = NUCLEOTIDE_COLORS.get(residue, '#95a5a6')
+    # Size the figure to the equal-aspect data box (plus room for the title)
+    # so it needs no bbox_inches='tight' cropping pass at save time
+    max_x = max(trna_df['seq_index'].max(), trna_df['global_index'].max()) * scale
+    fig_width = 20
+    fig_height = fig_width * 4.5 / (max_x + 7) + 1.2
+    fig, ax = plt.subplots(figsize=(fig_width, fig_height), layout='constrained')
 
-        # Top box (seq_index)
-        rect_top = mpatches.FancyBboxPatch((si-0.3, top_y), 0.6, 0.6,
-                                            boxstyle="round,pad=0.02",
-                                            facecolor=color, edgecolor='black')
-        ax.add_patch(rect_top)
+    # Fix the view up front; nothing drawn below needs to update the data limits
+    ax.set_xlim(-5, max_x + 2)
+    ax.set_ylim(-1, 3.5)
+    ax.set_aspect('equal')
+    ax.set_autoscale_on(False)
+
+    box_colors = residue_colors(trna_df['residue'])
+    label_colors = pd.Series(classify_labels(trna_df['sprinzl_label'])).map(
+        {'insertion': 'red', 'e-position': 'red'}).fillna('black')
+
+    seq_x = trna_df['seq_index'].to_numpy(dtype=float) * scale
+    global_x = trna_df['global_index'].to_numpy(dtype=float) * scale
+
+    # Top boxes (seq_index) and bottom boxes (global_index): one collection per row
+    for xs, y in ((seq_x, top_y), (global_x, bottom_y)):
+        boxes = [mpatches.FancyBboxPatch((x-0.3, y), 0.6, 0.6, boxstyle="round,pad=0.02")
+                 for x in xs]
+        ax.add_collection(PatchCollection(boxes, facecolor=box_colors, edgecolor='black'),
+                          autolim=False)
+
+    # Arrows connecting them, drawn as a single quiver (red = shifted, gray = unchanged)
+    shifted = seq_x != global_x
+    arrow_colors = np.where(shifted[:, None], to_rgba('red', 0.8), to_rgba('gray', 0.3))
+    ax.quiver(seq_x, np.full_like(seq_x, top_y), global_x - seq_x,
+              np.full_like(seq_x, bottom_y + 0.6 - top_y), color=arrow_colors,
+              angles='xy', scale_units='xy', scale=1, width=0.0005,
+              headwidth=6, headlength=8, headaxislength=7)
+
+    residues = trna_df['residue'].to_numpy()
+    labels = trna_df['sprinzl_label'].astype(object).fillna('?').astype(str).to_numpy()
+    seq_indices = trna_df['seq_index'].to_numpy(dtype=np.int64)
+
+    for si, gi, seq_idx, residue, label, label_color in zip(
+            seq_x, global_x, seq_indices, residues, labels, label_colors):
         ax.text(si, top_y+0.3, residue, ha='center', va='center', fontsize=8, fontweight='bold')
-        ax.text(si, top_y+0.8, str(int(row['seq_index'])), ha='center', va='bottom', fontsize=6)
-
-        # Bottom box (global_index)
-        rect_bot = mpatches.FancyBboxPatch((gi-0.3, bottom_y), 0.6, 0.6,
-                                            boxstyle="round,pad=0.02",
-                                            facecolor=color, edgecolor='black')
-        ax.add_patch(rect_bot)
+        ax.text(si, top_y+0.8, str(seq_idx), ha='center', va='bottom', fontsize=6)
         ax.text(gi, bottom_y+0.3, residue, ha='center', va='center', fontsize=8, fontweight='bold')
-        ax.text(gi, bottom_y-0.2, str(label), ha='center', va='top', fontsize=6,
-               color='red' if classify_label(label) in ['insertion', 'e-position'] else 'black')
-
-        # Arrow connecting them
-        arrow_color = 'red' if si != gi else 'gray'
-        alpha = 0.8 if si != gi else 0.3
-        ax.annotate('', xy=(gi, bottom_y+0.6), xytext=(si, top_y),
-                   arrowprops=dict(arrowstyle='->', color=arrow_color, alpha=alpha, lw=0.5))
+        ax.text(gi, bottom_y-0.2, label, ha='center', va='top', fontsize=6,
+               color=label_color)
 
     # Labels
     ax.text(-2, top_y+0.3, 'seq_index\n(5\'→3\')', ha='right', va='center', fontsize=10)
     ax.text(-2, bottom_y+0.3, 'global_index\n(aligned)', ha='right', va='center', fontsize=10)
 
-    max_x = max(trna_df['seq_index'].max(), trna_df['global_index'].max()) * scale
-    ax.set_xlim(-5, max_x + 2)
-    ax.set_ylim(-1, 3.5)
-    ax.set_aspect('equal')
     ax.axis('off')
 
     short_name = trna_id.replace('nuc-tRNA-', '')
@@ -398,13 +626,86 @@ def viz_05_arrow_schematic(df: pd.DataFrame, output_dir: Path):
                  'Top: sequence position → Bottom: aligned global_index\n'
                  'Red arrows = position shifts, Gray arrows = no change', fontsize=12)
 
-    plt.tight_layout()
-    plt.savefig(output_dir / '05_arrow_schematic.png', dpi=150, bbox_inches='tight')
+    plt.savefig(output_dir / '05_arrow_schematic.png', **SAVEFIG_KWARGS)
     plt.close()
     print(f"Saved: {output_dir / '05_arrow_schematic.png'}")
 
 
-def viz_06_text_alignment(df: pd.DataFrame, output_dir: Path,
+def draw_alignment_legend(ax, alignment_bottom: float, col2_x: float,
+                          row_height: float = 1.0) -> float:
+    """
+    Draw the static viz_06 LEGEND block below the alignment.
+
+    The legend is the same for every alignment figure apart from where its
+    second column starts (col2_x). Color swatches are drawn as one
+    PatchCollection. Returns the lowest y used, for setting the axis limits.
+    """
+    legend_y = alignment_bottom - row_height * 1.0
+    ax.axhline(legend_y + row_height * 0.5, color='gray', linewidth=0.5, linestyle='--', xmin=0, xmax=1)
+
+    # Legend title
+    legend_y -= row_height * 0.3
+    ax.text(0, legend_y, 'LEGEND', fontsize=11, fontweight='bold', va='top')
+
+    # Two columns for legend
+    col1_x = 0
+
+    # Column 1: Shared alignment coordinates
+    legend_y -= row_height * 0.7
+    ax.text(col1_x, legend_y, 'Shared (alignment coordinates)', fontsize=10, fontweight='bold', va='top')
+
+    legend_y -= row_height * 0.5
+    ax.text(col1_x, legend_y, 'global_index:', fontsize=9, fontweight='bold', va='top', style='italic',
+            color=OKABE_ITO['purple'])
+    ax.text(col1_x + 8, legend_y, 'unified coordinate (computed)', fontsize=9, va='top')
+
+    legend_y -= row_height * 0.4
+    ax.text(col1_x, legend_y, 'sprinzl_label:', fontsize=9, fontweight='bold', va='top', style='italic')
+    ax.text(col1_x + 8, legend_y, 'structural position (from R2DT)', fontsize=9, va='top')
+
+    legend_y -= row_height * 0.5
+    # sprinzl_label color key
+    swatches, swatch_colors = [], []
+    for label_type, color, lbl, xoff in [
+        ('standard', OKABE_ITO['black'], 'Standard (1-76)', 0),
+        ('insertion', OKABE_ITO['vermillion'], 'Insertion (20a)', 12),
+        ('e-position', OKABE_ITO['skyblue'], 'e-position (e1-e24)', 24)
+    ]:
+        swatches.append(mpatches.Rectangle((col1_x + xoff, legend_y - 0.12), 0.25, 0.25))
+        swatch_colors.append(color)
+        ax.text(col1_x + xoff + 0.4, legend_y, lbl, fontsize=8, va='center')
+
+    # Column 2: Per-tRNA data
+    legend_y2 = alignment_bottom - row_height * 1.7
+    ax.text(col2_x, legend_y2, 'Per-tRNA', fontsize=10, fontweight='bold', va='top')
+
+    legend_y2 -= row_height * 0.5
+    ax.text(col2_x, legend_y2, 'seq_index:', fontsize=9, fontweight='bold', va='top', style='italic', color='gray')
+    ax.text(col2_x + 6, legend_y2, "position in sequence 5'→3' (1-based)", fontsize=9, va='top')
+
+    legend_y2 -= row_height * 0.4
+    ax.text(col2_x, legend_y2, 'residue:', fontsize=9, fontweight='bold', va='top', style='italic')
+    ax.text(col2_x + 6, legend_y2, 'nucleotide (from input FASTA)', fontsize=9, va='top')
+
+    legend_y2 -= row_height * 0.5
+    # Nucleotide colors (Okabe-Ito)
+    for nuc, color, offset in [('A', NUCLEOTIDE_COLORS['A'], 0),
+                                ('C', NUCLEOTIDE_COLORS['C'], 2),
+                                ('G', NUCLEOTIDE_COLORS['G'], 4),
+                                ('T/U', NUCLEOTIDE_COLORS['T'], 6)]:
+        swatches.append(mpatches.Rectangle((col2_x + offset, legend_y2 - 0.12), 0.25, 0.25))
+        swatch_colors.append(color)
+        ax.text(col2_x + offset + 0.35, legend_y2, nuc, fontsize=8, va='center', fontweight='bold')
+
+    legend_y2 -= row_height * 0.4
+    ax.text(col2_x, legend_y2, '· or - = gap (position not present in this tRNA)', fontsize=8, va='center', color='gray')
+
+    ax.add_collection(PatchCollection(swatches, facecolor=swatch_colors), autolim=False)
+
+    return min(legend_y, legend_y2)
+
+
+def viz_06_text_alignment(ctx: AlignmentContext, output_dir: Path,
                           suffix: str = None, title: str = None,
                           max_trnas: int = 5):
     """
@@ -412,66 +713,36 @@ def viz_06_text_alignment(df: pd.DataFrame, output_dir: Path,
     Shows all 4 columns: global_index, sprinzl_label (shared), seq_index, residue (per-tRNA).
 
     Parameters:
-        df: DataFrame with tRNA alignment data
+        ctx: AlignmentContext for the tRNA alignment data
         output_dir: Directory to save output
         suffix: Optional suffix for filename (e.g., 'offset0_type2')
         title: Optional custom title
         max_trnas: Maximum number of tRNAs to show (default 5)
     """
     # Select a sample of tRNAs - auto-detect what amino acids are present
-    trna_ids = df['trna_id'].unique()
-
-    # Extract amino acid from tRNA IDs and find representative samples
-    aa_to_trnas = {}
-    for trna_id in trna_ids:
-        # Extract amino acid from tRNA ID (e.g., 'nuc-tRNA-Leu-CAA-1-1' -> 'Leu')
-        parts = trna_id.replace('nuc-tRNA-', '').split('-')
-        if parts:
-            aa = parts[0]
-            if aa not in aa_to_trnas:
-                aa_to_trnas[aa] = []
-            aa_to_trnas[aa].append(trna_id)
-
-    # Select diverse samples: prioritize variety across amino acids
-    sample_trnas = []
-    for aa in sorted(aa_to_trnas.keys()):
-        if len(sample_trnas) >= max_trnas:
-            break
-        # Take first tRNA of each amino acid type
-        sample_trnas.append(aa_to_trnas[aa][0])
-
-    # If we have fewer amino acids than max, add more from same aa
-    if len(sample_trnas) < max_trnas:
-        for aa in sorted(aa_to_trnas.keys()):
-            for trna in aa_to_trnas[aa][1:]:
-                if len(sample_trnas) >= max_trnas:
-                    break
-                if trna not in sample_trnas:
-                    sample_trnas.append(trna)
-            if len(sample_trnas) >= max_trnas:
-                break
-
-    sample_trnas = sample_trnas[:max_trnas]
-
-    df_sample = df[df['trna_id'].isin(sample_trnas)]
-
-    # Create alignment matrices for residue and seq_index
-    alignment_residue = df_sample.pivot_table(
-        index='trna_id',
-        columns='global_index',
-        values='residue',
-        aggfunc='first'
-    ).fillna('-')
-
-    alignment_seqidx = df_sample.pivot_table(
-        index='trna_id',
-        columns='global_index',
-        values='seq_index',
-        aggfunc='first'
-    )  # Keep NaN for gaps
+    # Extract amino acid from tRNA IDs (e.g., 'nuc-tRNA-Leu-CAA-1-1' -> 'Leu')
+    ids = pd.Series(ctx.trna_ids, dtype=object)
+    aa = ids.str.extract(r'^(?:nuc-tRNA-)?([^-]*)', expand=False)
+    order = (pd.DataFrame({'id': ids, 'aa': aa})
+             .sort_values('aa', kind='stable'))
+
+    # Select diverse samples: first tRNA of each amino acid type, then, if we
+    # have fewer amino acids than max, the remaining tRNAs in the same order
+    first_per_aa = order.drop_duplicates('aa')
+    rest = order.drop(first_per_aa.index)
+    sample_trnas = pd.concat([first_per_aa, rest])['id'].head(max_trnas).tolist()
+
+    df_sample = ctx.trna_rows(sample_trnas)
+
+    # Create alignment matrices for residue and seq_index from a single reshape
+    wide = (df_sample.drop_duplicates(['trna_id', 'global_index'])
+            .set_index(['trna_id', 'global_index'])[['residue', 'seq_index']]
+            .unstack('global_index'))
+    alignment_residue = wide['residue'].astype(object).fillna('-')
+    alignment_seqidx = wide['seq_index']  # Keep NaN for gaps
 
     # Get labels for header
-    label_map = df.groupby('global_index')['sprinzl_label'].first()
+    label_map = ctx.label_by_gi
 
     # Build the alignment as strings for cleaner rendering
     cols = alignment_residue.columns.tolist()
@@ -481,7 +752,7 @@ def viz_06_text_alignment(df: pd.DataFrame, output_dir: Path,
     # Figure size based on content - each tRNA needs 2 rows (seq_index + residue)
     fig_width = max(18, n_cols * 0.20)
     fig_height = max(6, (n_trnas * 1.8 + 4) * 0.5 + 3)  # condensed rows per tRNA + headers + legend
-    fig, ax = plt.subplots(figsize=(fig_width, fig_height))
+    fig, ax = plt.subplots(figsize=(fig_width, fig_height), layout='constrained')
 
     # Use a tight grid layout
     row_height = 1.0
@@ -532,6 +803,14 @@ def viz_06_text_alignment(df: pd.DataFrame, output_dir: Path,
     ax.axhline(y, color='black', linewidth=1.5, xmin=0, xmax=1)
 
     # --- PER-tRNA ROWS ---
+    # Cell glyphs are collected across all tRNAs and drawn as one collection
+    # per text style instead of one Text artist per cell.
+    col_x = x_start + np.arange(n_cols) * col_width
+    seq_x, seq_y, seq_text, seq_color = [], [], [], []
+    res_x, res_y, res_text, res_color = [], [], [], []
+    gap_x, gap_y = [], []
+    lightgray = to_rgba('lightgray')
+    gray = to_rgba('gray')
     for trna_id in alignment_residue.index:
         # tRNA name header
         y -= row_height * 0.6
@@ -541,98 +820,45 @@ def viz_06_text_alignment(df: pd.DataFrame, output_dir: Path,
         # seq_index row (tighter)
         y -= row_height * 0.45
         ax.text(0, y, '  seq_index:', fontsize=8, fontfamily='monospace', va='center', color='gray')
-        seq_idx_row = alignment_seqidx.loc[trna_id]
-        for i, col in enumerate(cols):
-            x = x_start + i * col_width
-            val = seq_idx_row[col]
-            if pd.isna(val):
-                ax.text(x, y, '-', fontsize=8, fontfamily='monospace', ha='center', va='center', color='lightgray')
-            else:
-                ax.text(x, y, str(int(val)), fontsize=8, fontfamily='monospace', ha='center', va='center', color='gray')
+        seq_idx_row = alignment_seqidx.loc[trna_id].to_numpy(dtype=float)
+        is_gap = np.isnan(seq_idx_row)
+        seq_x.append(col_x)
+        seq_y.append(np.full(n_cols, y))
+        seq_text.extend('-' if gap else str(int(val)) for val, gap in zip(seq_idx_row, is_gap))
+        seq_color.append(np.where(is_gap[:, None], lightgray, gray))
 
         # residue row (tighter)
         y -= row_height * 0.45
         ax.text(0, y, '  residue:', fontsize=8, fontfamily='monospace', va='center', color='gray')
-        residue_row = alignment_residue.loc[trna_id]
-        for i, col in enumerate(cols):
-            x = x_start + i * col_width
-            residue = residue_row[col]
-            if residue == '-':
-                ax.text(x, y, '·', fontsize=10, fontfamily='monospace', ha='center', va='center', color='lightgray')
-            else:
-                color = NUCLEOTIDE_COLORS.get(residue, 'black')
-                ax.text(x, y, residue, fontsize=10, fontfamily='monospace', ha='center', va='center',
-                        color=color, fontweight='bold')
+        residue_row = alignment_residue.loc[trna_id].to_numpy(dtype=object)
+        is_gap = residue_row == '-'
+        gap_x.append(col_x[is_gap])
+        gap_y.append(np.full(is_gap.sum(), y))
+        res_x.append(col_x[~is_gap])
+        res_y.append(np.full((~is_gap).sum(), y))
+        res_text.extend(residue_row[~is_gap])
+        res_color.append([NUCLEOTIDE_COLORS.get(residue, 'black') for residue in residue_row[~is_gap]])
 
         # Small gap between tRNAs
         y -= row_height * 0.2
 
+    if n_trnas:
+        add_glyphs(ax, np.concatenate(seq_x), np.concatenate(seq_y), seq_text,
+                   np.concatenate(seq_color), fontsize=8)
+        add_glyphs(ax, np.concatenate(gap_x), np.concatenate(gap_y),
+                   ['·'] * sum(map(len, gap_x)), 'lightgray', fontsize=10)
+        add_glyphs(ax, np.concatenate(res_x), np.concatenate(res_y), res_text,
+                   [c for row in res_color for c in row], fontsize=10, fontweight='bold')
+
     # Store bottom of alignment for legend positioning
     alignment_bottom = y - row_height * 0.5
 
     # --- LEGEND SECTION ---
-    legend_y = alignment_bottom - row_height * 1.0
-    ax.axhline(legend_y + row_height * 0.5, color='gray', linewidth=0.5, linestyle='--', xmin=0, xmax=1)
-
-    # Legend title
-    legend_y -= row_height * 0.3
-    ax.text(0, legend_y, 'LEGEND', fontsize=11, fontweight='bold', va='top')
-
-    # Two columns for legend
-    col1_x = 0
-    col2_x = x_start + n_cols * col_width * 0.35
-
-    # Column 1: Shared alignment coordinates
-    legend_y -= row_height * 0.7
-    ax.text(col1_x, legend_y, 'Shared (alignment coordinates)', fontsize=10, fontweight='bold', va='top')
-
-    legend_y -= row_height * 0.5
-    ax.text(col1_x, legend_y, 'global_index:', fontsize=9, fontweight='bold', va='top', style='italic',
-            color=OKABE_ITO['purple'])
-    ax.text(col1_x + 8, legend_y, 'unified coordinate (computed)', fontsize=9, va='top')
-
-    legend_y -= row_height * 0.4
-    ax.text(col1_x, legend_y, 'sprinzl_label:', fontsize=9, fontweight='bold', va='top', style='italic')
-    ax.text(col1_x + 8, legend_y, 'structural position (from R2DT)', fontsize=9, va='top')
-
-    legend_y -= row_height * 0.5
-    # sprinzl_label color key
-    for label_type, color, lbl, xoff in [
-        ('standard', OKABE_ITO['black'], 'Standard (1-76)', 0),
-        ('insertion', OKABE_ITO['vermillion'], 'Insertion (20a)', 12),
-        ('e-position', OKABE_ITO['skyblue'], 'e-position (e1-e24)', 24)
-    ]:
-        rect = mpatches.Rectangle((col1_x + xoff, legend_y - 0.12), 0.25, 0.25, facecolor=color)
-        ax.add_patch(rect)
-        ax.text(col1_x + xoff + 0.4, legend_y, lbl, fontsize=8, va='center')
-
-    # Column 2: Per-tRNA data
-    legend_y2 = alignment_bottom - row_height * 1.7
-    ax.text(col2_x, legend_y2, 'Per-tRNA', fontsize=10, fontweight='bold', va='top')
-
-    legend_y2 -= row_height * 0.5
-    ax.text(col2_x, legend_y2, 'seq_index:', fontsize=9, fontweight='bold', va='top', style='italic', color='gray')
-    ax.text(col2_x + 6, legend_y2, "position in sequence 5'→3' (1-based)", fontsize=9, va='top')
-
-    legend_y2 -= row_height * 0.4
-    ax.text(col2_x, legend_y2, 'residue:', fontsize=9, fontweight='bold', va='top', style='italic')
-    ax.text(col2_x + 6, legend_y2, 'nucleotide (from input FASTA)', fontsize=9, va='top')
-
-    legend_y2 -= row_height * 0.5
-    # Nucleotide colors (Okabe-Ito)
-    for nuc, color, offset in [('A', NUCLEOTIDE_COLORS['A'], 0),
-                                ('C', NUCLEOTIDE_COLORS['C'], 2),
-                                ('G', NUCLEOTIDE_COLORS['G'], 4),
-                                ('T/U', NUCLEOTIDE_COLORS['T'], 6)]:
-        rect = mpatches.Rectangle((col2_x + offset, legend_y2 - 0.12), 0.25, 0.25, facecolor=color)
-        ax.add_patch(rect)
-        ax.text(col2_x + offset + 0.35, legend_y2, nuc, fontsize=8, va='center', fontweight='bold')
-
-    legend_y2 -= row_height * 0.4
-    ax.text(col2_x, legend_y2, '· or - = gap (position not present in this tRNA)', fontsize=8, va='center', color='gray')
+    legend_bottom = draw_alignment_legend(ax, alignment_bottom, x_start + n_cols * col_width * 0.35,
+                                          row_height)
 
     # Set axis limits
-    final_bottom = min(legend_y, legend_y2) - row_height * 1.0
+    final_bottom = legend_bottom - row_height * 1.0
     ax.set_xlim(-1, x_start + n_cols * col_width + 1)
     ax.set_ylim(final_bottom, y_start + row_height * 1.5)
     ax.axis('off')
@@ -648,19 +874,59 @@ def viz_06_text_alignment(df: pd.DataFrame, output_dir: Path,
 
     ax.set_title(fig_title, fontsize=12, fontweight='bold', pad=10)
 
-    plt.tight_layout()
-
     # Dynamic filename based on suffix
     if suffix:
         output_filename = f'{suffix}_alignment.png'
     else:
         output_filename = '06_text_alignment.png'
 
-    plt.savefig(output_dir / output_filename, dpi=150, bbox_inches='tight')
+    plt.savefig(output_dir / output_filename, **SAVEFIG_KWARGS)
     plt.close()
     print(f"Saved: {output_dir / output_filename}")
 
 
+def _render_alignment(filepath: Path, output_dir: Path, suffix: str, title: str,
+                      max_trnas: int = None):
+    """
+    Load one global_coords file and render its viz_06 alignment.
+
+    Module-level so it can run in a worker process. If max_trnas is None it is
+    derived from the group size (up to 5).
+    """
+    ctx = AlignmentContext.from_frame(load_data(filepath))
+    print(f"Processing: {filepath.name}\n  Loaded {len(ctx.df)} rows, {ctx.n_trnas} tRNAs")
+
+    if max_trnas is None:
+        max_trnas = min(5, ctx.n_trnas)
+
+    viz_06_text_alignment(ctx, output_dir, suffix=suffix, title=title, max_trnas=max_trnas)
+
+
+def _render_alignments(jobs: list, output_dir: Path, outputs_dir: Path):
+    """
+    Render (filename, suffix, title, max_trnas) jobs in parallel worker processes.
+
+    Each figure is independent and CPU-bound in Agg rendering and PNG encoding;
+    matplotlib is not thread-safe, so processes are used rather than threads.
+    """
+    present = []
+    for filename, suffix, title, max_trnas in jobs:
+        filepath = outputs_dir / filename
+        if not filepath.exists():
+            print(f"  Skipping {filename} (file not found)")
+            continue
+        present.append((filepath, output_dir, suffix, title, max_trnas))
+
+    if not present:
+        return
+
+    with ProcessPoolExecutor(max_workers=min(len(present), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(_render_alignment, *job) for job in present]
+        for future in futures:
+            future.result()  # re-raise any worker error
+    print()
+
+
 def generate_all_yeast_alignments(output_dir: Path, outputs_dir: Path):
     """
     Generate alignment visualizations for all yeast offset groups.
@@ -669,37 +935,23 @@ def generate_all_yeast_alignments(output_dir: Path, outputs_dir: Path):
         output_dir: Directory to save figures
         outputs_dir: Directory containing the global_coords TSV files
     """
-    # All yeast data files with their suffixes and descriptive titles
+    # All yeast data files with their suffixes, descriptive titles and tRNA
+    # limits (None = up to 5, depending on group size)
     YEAST_FILES = [
         ('sacCer_global_coords_offset-1_type2.tsv', 'offset-1_type2',
-         'S. cerevisiae Type II tRNAs (offset -1): Full Coordinate Alignment Path'),
+         'S. cerevisiae Type II tRNAs (offset -1): Full Coordinate Alignment Path', None),
         ('sacCer_global_coords_offset+1_type1.tsv', 'offset+1_type1',
-         'S. cerevisiae Type I tRNAs (offset +1): Full Coordinate Alignment Path'),
+         'S. cerevisiae Type I tRNAs (offset +1): Full Coordinate Alignment Path', None),
         ('sacCer_global_coords_offset0_type1.tsv', 'offset0_type1',
-         'S. cerevisiae Type I tRNAs (offset 0): Full Coordinate Alignment Path'),
+         'S. cerevisiae Type I tRNAs (offset 0): Full Coordinate Alignment Path', None),
         ('sacCer_global_coords_offset0_type2.tsv', 'offset0_type2',
-         'S. cerevisiae Type II tRNAs (offset 0): Full Coordinate Alignment Path'),
+         'S. cerevisiae Type II tRNAs (offset 0): Full Coordinate Alignment Path', None),
     ]
 
     print("Generating alignment visualizations for all yeast offset groups...")
     print()
 
-    for filename, suffix, title in YEAST_FILES:
-        filepath = outputs_dir / filename
-        if not filepath.exists():
-            print(f"  Skipping {filename} (file not found)")
-            continue
-
-        print(f"Processing: {filename}")
-        df = load_data(filepath)
-        n_trnas = df['trna_id'].nunique()
-        print(f"  Loaded {len(df)} rows, {n_trnas} tRNAs")
-
-        # Determine max_trnas based on group size
-        max_trnas = min(5, n_trnas)
-
-        viz_06_text_alignment(df, output_dir, suffix=suffix, title=title, max_trnas=max_trnas)
-        print()
+    _render_alignments(YEAST_FILES, output_dir, outputs_dir)
 
     print("All yeast alignment visualizations complete.")
 
@@ -722,19 +974,7 @@ def generate_mito_alignments(output_dir: Path, outputs_dir: Path):
     print("Generating alignment visualizations for mitochondrial tRNAs...")
     print()
 
-    for filename, suffix, title, max_trnas in MITO_FILES:
-        filepath = outputs_dir / filename
-        if not filepath.exists():
-            print(f"  Skipping {filename} (file not found)")
-            continue
-
-        print(f"Processing: {filename}")
-        df = load_data(filepath)
-        n_trnas = df['trna_id'].nunique()
-        print(f"  Loaded {len(df)} rows, {n_trnas} tRNAs")
-
-        viz_06_text_alignment(df, output_dir, suffix=suffix, title=title, max_trnas=max_trnas)
-        print()
+    _render_alignments(MITO_FILES, output_dir, outputs_dir)
 
     print("All mitochondrial tRNA alignment visualizations complete.")
 
@@ -770,18 +1010,18 @@ def main():
         input_file = outputs_dir / 'sacCer_global_coords_offset0_type2.tsv'
 
         print(f"Loading data from: {input_file}")
-        df = load_data(input_file)
-        print(f"Loaded {len(df)} rows, {df['trna_id'].nunique()} tRNAs")
+        ctx = AlignmentContext.from_frame(load_data(input_file))
+        print(f"Loaded {len(ctx.df)} rows, {ctx.n_trnas} tRNAs")
         print()
 
         # Generate all visualizations
         print("Generating visualizations...")
-        viz_01_label_mapping(df, output_dir)
-        viz_02_heatmap(df, output_dir)
-        viz_03_coverage(df, output_dir)
-        viz_04_ruler_tracks(df, output_dir)
-        viz_05_arrow_schematic(df, output_dir)
-        viz_06_text_alignment(df, output_dir)
+        viz_01_label_mapping(ctx, output_dir)
+        viz_02_heatmap(ctx, output_dir)
+        viz_03_coverage(ctx, output_dir)
+        viz_04_ruler_tracks(ctx, output_dir)
+        viz_05_arrow_schematic(ctx, output_dir)
+        viz_06_text_alignment(ctx, output_dir)
 
         print()
         print(f"All visualizations saved to: {output_dir}")
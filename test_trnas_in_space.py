@@ -6,18 +6,128 @@ Run with: python -m pytest test_trnas_in_space.py -v
 Or: python test_trnas_in_space.py
 """
 
+import importlib.util
+import logging
 import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
+import pytest
 
 # Add scripts directory to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), "scripts"))
 
 import trnas_in_space  # noqa: E402
 
+logger = logging.getLogger(__name__)
+
+OUTPUTS_DIR = Path(__file__).parent / "outputs"
+
+# One listing of outputs/ shared by every test (name -> path), instead of each
+# test re-globbing the directory and stat-ing files
+if OUTPUTS_DIR.is_dir():
+    with os.scandir(OUTPUTS_DIR) as entries:
+        OUTPUT_FILES = {e.name: Path(e.path) for e in sorted(entries, key=lambda e: e.name)}
+else:
+    OUTPUT_FILES = {}
+
+# Columns the tests actually read from the output tables. source_file and the
+# float sprinzl_ordinal/sprinzl_continuous columns are never inspected beyond
+# the header, so they are not parsed (test_output_file_structure checks the
+# full header separately).
+OUTPUT_COLUMNS = [
+    "trna_id",
+    "seq_index",
+    "sprinzl_index",
+    "sprinzl_label",
+    "residue",
+    "global_index",
+    "region",
+]
+
+# Compact dtypes for the output tables: int32 indices, nullable global_index,
+# and categorical low-cardinality text columns. sprinzl_label is categorical
+# too (read as text, so never floats like "55.0"), which turns the label
+# isin/eq checks into comparisons on small integer codes; its categories come
+# from the data, since real labels include lowercase insertions like "17a".
+# trna_id stays plain text because the tests group and iterate on it per tRNA.
+OUTPUT_DTYPES = {
+    "seq_index": "int32",
+    "sprinzl_index": "int32",
+    "global_index": "Int32",
+    "sprinzl_label": "category",
+    "residue": "category",
+    "region": "category",
+}
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+# Region names assign_region_from_sprinzl() can produce
+VALID_REGIONS = frozenset([
+    "acceptor-stem",
+    "acceptor-tail",
+    "D-stem",
+    "D-loop",
+    "anticodon-stem",
+    "anticodon-loop",
+    "variable-region",
+    "variable-arm",
+    "T-stem",
+    "T-loop",
+    "unknown",
+])
+
+# Coordinate tables bucketed from the single OUTPUT_FILES listing: every
+# *_global_coords*.tsv, and the unified files among them. Per-file tests are
+# parametrized over UNIFIED_FILES so they can be sharded with `pytest -n auto`.
+COORD_FILES = [
+    name for name in OUTPUT_FILES if "_global_coords" in name and name.endswith(".tsv")
+]
+UNIFIED_FILES = [
+    name for name in COORD_FILES
+    if name.endswith("_global_coords.tsv") and "offset" not in name
+]
+# Nuclear unified files: mito tables keep R2DT's own label order, which has
+# known reorderings (e.g. mito-tRNA-Leu-UAA "17a" before "17"), so the
+# seq-order invariant is only enforced on nuclear coordinates
+NUCLEAR_FILES = [name for name in UNIFIED_FILES if "mito" not in name.lower()]
+
+
+@lru_cache(maxsize=None)
+def read_output_tables():
+    """
+    Parse every outputs/*_global_coords*.tsv once, keyed by file name.
+
+    Only OUTPUT_COLUMNS are parsed, with OUTPUT_DTYPES (so labels are
+    categorical text, never floats like "55.0"), using the pyarrow CSV engine
+    when it is installed. Rows are sorted by (trna_id, seq_index) once here
+    (the pipeline writes them in that order, so this is cheap), and tests
+    that walk each tRNA in sequence order rely on it instead of re-sorting.
+    Files are read concurrently: parsing releases the GIL, so the total is
+    close to the slowest single read. Callers must not modify the returned
+    DataFrames; they are shared by every test.
+    """
+    files = [OUTPUT_FILES[name] for name in COORD_FILES]
+
+    def read(f):
+        df = pd.read_csv(
+            f, sep="\t", usecols=OUTPUT_COLUMNS, dtype=OUTPUT_DTYPES, engine=CSV_ENGINE
+        )
+        return df.sort_values(["trna_id", "seq_index"], kind="stable", ignore_index=True)
+
+    with ThreadPoolExecutor() as ex:
+        return {f.name: df for f, df in zip(files, ex.map(read, files))}
+
+
+@pytest.fixture(scope="session")
+def output_dfs():
+    """Output tables shared across the test session (see read_output_tables)."""
+    return read_output_tables()
+
 
 def test_imports():
     """Test that all required modules can be imported."""
@@ -27,142 +137,232 @@ def test_imports():
     assert hasattr(trnas_in_space, "assign_region_from_sprinzl")
 
 
-def test_sort_key():
+# (before, after) label pairs: sort_key(before) < sort_key(after)
+SORT_ORDER_CASES = [
+    # Numeric labels
+    ("1", "2"),
+    ("10", "20"),
+    # Labels with suffixes
+    ("20", "20A"),
+    ("20A", "20B"),
+    # Type II extended variable arm positions (e1-e27) sort after position 45
+    # but before 46 (reserved coordinate space), in biological hairpin order:
+    # e11→e17, e18→e20, e1→e5, e6→e10, e27→e21
+    ("45", "e11"),
+    ("e11", "e12"),
+    ("e12", "e13"),
+    ("e17", "e1"),  # e17 before e1 (hairpin)
+    ("e1", "e2"),
+    ("e5", "e27"),  # e5 before e27 (hairpin)
+    ("e27", "e26"),  # descending
+    ("e21", "46"),
+    # "e" positions sort in reserved coordinate space
+    ("e11", "46"),
+    # e positions don't sort at the end (old bug)
+    ("e1", "76"),
+    # Empty/nan labels sort to the end
+    ("1", ""),
+    ("1", "nan"),
+    ("e21", ""),
+]
+
+
+@pytest.mark.parametrize("before,after", SORT_ORDER_CASES)
+def test_sort_key_order(before, after):
     """Test the sort_key function for Sprinzl label ordering."""
-    # Test numeric labels
-    assert trnas_in_space.sort_key("1") < trnas_in_space.sort_key("2")
-    assert trnas_in_space.sort_key("10") < trnas_in_space.sort_key("20")
-
-    # Test labels with suffixes
-    assert trnas_in_space.sort_key("20") < trnas_in_space.sort_key("20A")
-    assert trnas_in_space.sort_key("20A") < trnas_in_space.sort_key("20B")
-
-    # Test Type II extended variable arm positions (e1-e27)
-    # These should sort after position 45 but before 46 (reserved coordinate space)
-    # Biological hairpin order: e11→e17, e18→e20, e1→e5, e6→e10, e27→e21
-    assert trnas_in_space.sort_key("45") < trnas_in_space.sort_key("e11")
-    assert trnas_in_space.sort_key("e11") < trnas_in_space.sort_key("e12")
-    assert trnas_in_space.sort_key("e12") < trnas_in_space.sort_key("e13")
-    assert trnas_in_space.sort_key("e17") < trnas_in_space.sort_key("e1")  # e17 before e1 (hairpin)
-    assert trnas_in_space.sort_key("e1") < trnas_in_space.sort_key("e2")
-    assert trnas_in_space.sort_key("e5") < trnas_in_space.sort_key("e27")  # e5 before e27 (hairpin)
-    assert trnas_in_space.sort_key("e27") < trnas_in_space.sort_key("e26")  # descending
-    assert trnas_in_space.sort_key("e21") < trnas_in_space.sort_key("46")
-
-    # Test that "e" positions sort in reserved coordinate space
-    assert trnas_in_space.sort_key("e11") < trnas_in_space.sort_key("46")
-    assert trnas_in_space.sort_key("e21") < trnas_in_space.sort_key("46")
-
-    # Test that e positions don't sort at the end (old bug)
-    assert trnas_in_space.sort_key("e1") < trnas_in_space.sort_key("76")
+    assert trnas_in_space.sort_key(before) < trnas_in_space.sort_key(after)
+
 
+def test_sort_key():
+    """Test sort_key over a full extended variable arm, and its cache."""
     # Comprehensive ordering test for extended variable arm (biological hairpin order)
     # Order: 45, e11→e14, e1→e4, e24→e22, 46
     labels = ["44", "45", "e11", "e12", "e13", "e14", "e1", "e2", "e3", "e4", "e24", "e23", "e22", "e21", "46", "47"]
     sorted_labels = sorted(labels, key=trnas_in_space.sort_key)
     assert sorted_labels == labels, f"Expected {labels}, got {sorted_labels}"
 
-    # Test empty/nan labels (should sort to end)
-    assert trnas_in_space.sort_key("1") < trnas_in_space.sort_key("")
-    assert trnas_in_space.sort_key("1") < trnas_in_space.sort_key("nan")
-    assert trnas_in_space.sort_key("e21") < trnas_in_space.sort_key("")
+    # Keys are cached: "e11" was keyed above, and its cached key compares
+    # equal to a freshly computed one
+    assert trnas_in_space.sort_key("e11") == trnas_in_space.sort_key.__wrapped__("e11")
+    assert trnas_in_space.sort_key.cache_info().hits > 0
 
 
-def test_sprinzl_numeric_from_label():
-    """Test extraction of numeric part from Sprinzl labels."""
-    assert trnas_in_space.sprinzl_numeric_from_label("20") == 20
-    assert trnas_in_space.sprinzl_numeric_from_label("20A") == 20
-    assert trnas_in_space.sprinzl_numeric_from_label("20B") == 20
-    assert trnas_in_space.sprinzl_numeric_from_label("1") == 1
-    assert trnas_in_space.sprinzl_numeric_from_label("76") == 76
-    assert trnas_in_space.sprinzl_numeric_from_label(None) is None
+# Label sets for the vectorized sort keys: one mixing every label kind, plus
+# sets made of a single kind (each kind's mask then covers every row)
+SORT_KEYS_CASES = [
+    ["", "nan", None, "1", "1.0", " 7 ", "9.1", "20", "20a", "20B", "45",
+     "e11", "e12", "e1", "e21", "e99", "46", "76", "X"],
+    ["e1"],
+    ["e1", "e2"],
+    ["e17", "e1", "e27", "e99"],
+    ["9.1"],
+    ["20a", "20"],
+    ["X"],
+    ["", None],
+]
 
 
-def test_assign_region_from_sprinzl():
-    """Test region assignment based on Sprinzl position."""
-    # Acceptor stem
-    assert trnas_in_space.assign_region_from_sprinzl(1) == "acceptor-stem"
-    assert trnas_in_space.assign_region_from_sprinzl(7) == "acceptor-stem"
-    assert trnas_in_space.assign_region_from_sprinzl(66) == "acceptor-stem"
-    assert trnas_in_space.assign_region_from_sprinzl(72) == "acceptor-stem"
+@pytest.mark.parametrize("labels", SORT_KEYS_CASES)
+def test_sort_keys_matches_sort_key(labels):
+    """Test that the vectorized sort_keys/sort_labels agree with sort_key."""
+    keys = trnas_in_space.sort_keys(labels)
+    for label, key in zip(labels, keys.itertuples(index=False)):
+        assert tuple(key) == trnas_in_space.sort_key(label), f"Key mismatch for {label!r}"
 
-    # Acceptor tail
-    assert trnas_in_space.assign_region_from_sprinzl(73) == "acceptor-tail"
-    assert trnas_in_space.assign_region_from_sprinzl(74) == "acceptor-tail"
+    expected = [trnas_in_space.sort_key(x) for x in sorted(labels, key=trnas_in_space.sort_key)]
+    actual = [trnas_in_space.sort_key(x) for x in trnas_in_space.sort_labels(labels[::-1])]
+    assert actual == expected
 
-    # Anticodon loop
-    assert trnas_in_space.assign_region_from_sprinzl(34) == "anticodon-loop"
-    assert trnas_in_space.assign_region_from_sprinzl(35) == "anticodon-loop"
-    assert trnas_in_space.assign_region_from_sprinzl(36) == "anticodon-loop"
+    # Packed codes order every pair of labels exactly like the key tuples
+    codes = trnas_in_space.sort_codes(labels)
+    keys = [trnas_in_space.sort_key(x) for x in labels]
+    for i in range(len(labels)):
+        for j in range(len(labels)):
+            assert (codes[i] < codes[j]) == (keys[i] < keys[j]), (labels[i], labels[j])
 
-    # D-loop
-    assert trnas_in_space.assign_region_from_sprinzl(14) == "D-loop"
-    assert trnas_in_space.assign_region_from_sprinzl(20) == "D-loop"
 
-    # T-loop
-    assert trnas_in_space.assign_region_from_sprinzl(54) == "T-loop"
-    assert trnas_in_space.assign_region_from_sprinzl(60) == "T-loop"
+# (label, expected) ground truth for sprinzl_numeric_from_label()
+SPRINZL_NUMERIC_CASES = [("20", 20), ("20A", 20), ("20B", 20), ("1", 1), ("76", 76), (None, None)]
+
 
+@pytest.mark.parametrize("label,expected", SPRINZL_NUMERIC_CASES)
+def test_sprinzl_numeric_from_label(label, expected):
+    """Test extraction of numeric part from Sprinzl labels."""
+    assert trnas_in_space.sprinzl_numeric_from_label(label) == expected
+
+
+def test_sprinzl_numeric_from_labels_matches_scalar():
+    """Test that the batch label parser agrees with the scalar one."""
+    labels = [label for label, _ in SPRINZL_NUMERIC_CASES] + ["20a", "14:i1", "e12", "", "20"]
+    expected = [trnas_in_space.sprinzl_numeric_from_label(x) for x in labels]
+    expected = [np.nan if x is None else x for x in expected]
+    np.testing.assert_array_equal(trnas_in_space.sprinzl_numeric_from_labels(labels), expected)
+
+
+# (sprinzl_index values in seq order, expected after inference)
+INFER_CASES = [
+    # Single gap between consistent neighbours is filled
+    ([5, -1, 7], [5, 6, 7]),
+    # Leading/trailing gaps extrapolate from the only neighbour
+    ([-1, -1, 3, 4, -1], [1, 2, 3, 4, 5]),
+    # Insertion (neighbours disagree) stays unresolved
+    ([20, -1, 21], [20, -1, 21]),
+    # Extrapolation outside 1..76 is rejected
+    ([-1, 1], [-1, 1]),
+    ([76, -1], [76, -1]),
+    # No anchors at all
+    ([-1, -1], [-1, -1]),
+    ([], []),
+]
+
+
+@pytest.mark.parametrize("vals,expected", INFER_CASES)
+def test_infer_sprinzl_indices(vals, expected):
+    """Test monotone filling of missing sprinzl_index values."""
+    np.testing.assert_array_equal(trnas_in_space.infer_sprinzl_indices(vals), expected)
+
+
+# (position, expected) ground truth for assign_region_from_sprinzl()
+REGION_CASES = [
+    # Acceptor stem
+    (1, "acceptor-stem"),
+    (7, "acceptor-stem"),
+    (66, "acceptor-stem"),
+    (72, "acceptor-stem"),
+    # Acceptor tail
+    (73, "acceptor-tail"),
+    (74, "acceptor-tail"),
+    # Anticodon loop
+    (34, "anticodon-loop"),
+    (35, "anticodon-loop"),
+    (36, "anticodon-loop"),
+    # D-loop
+    (14, "D-loop"),
+    (20, "D-loop"),
+    # T-loop
+    (54, "T-loop"),
+    (60, "T-loop"),
     # Unknown
-    assert trnas_in_space.assign_region_from_sprinzl(None) == "unknown"
+    (None, "unknown"),
+]
 
 
-def test_infer_trna_id_from_filename():
-    """Test tRNA ID inference from filenames."""
-    # Standard enriched.json format
-    assert (
-        trnas_in_space.infer_trna_id_from_filename("tRNA-Ala-AGC-1-1-B_Ala.enriched.json")
-        == "tRNA-Ala-AGC-1-1"
-    )
+@pytest.mark.parametrize("position,expected", REGION_CASES)
+def test_assign_region_from_sprinzl(position, expected):
+    """Test region assignment based on Sprinzl position."""
+    assert trnas_in_space.assign_region_from_sprinzl(position) == expected
 
-    # Simple format
-    assert trnas_in_space.infer_trna_id_from_filename("example.enriched.json") == "example"
 
+def test_assign_regions_from_sprinzl_matches_scalar():
+    """Test that the vectorized region assignment agrees with the scalar one."""
+    # Whole positions use the lookup table; a fractional one forces the range checks
+    for positions in ([None, -1, 0, *range(1, 80), 200], [None, -1, 0, *range(1, 80), 46.5, 200]):
+        expected = [trnas_in_space.assign_region_from_sprinzl(p) for p in positions]
+        base_num = [np.nan if p is None else p for p in positions]
+        assert trnas_in_space.assign_regions_from_sprinzl(base_num).tolist() == expected
+
+
+# (filename, expected) ground truth for infer_trna_id_from_filename()
+FILENAME_CASES = [
+    # Standard enriched.json format
+    ("tRNA-Ala-AGC-1-1-B_Ala.enriched.json", "tRNA-Ala-AGC-1-1"),
+    # Simple format
+    ("example.enriched.json", "example"),
     # With path
-    assert (
-        trnas_in_space.infer_trna_id_from_filename("/path/to/tRNA-Leu-CAA-1-1-B_Leu.enriched.json")
-        == "tRNA-Leu-CAA-1-1"
-    )
+    ("/path/to/tRNA-Leu-CAA-1-1-B_Leu.enriched.json", "tRNA-Leu-CAA-1-1"),
+    # DNA anticodon converted to RNA (T -> U), including Ile2/fMet style amino acids
+    ("nuc-tRNA-Ala-TGC-1-1-E_Ala.enriched.json", "nuc-tRNA-Ala-UGC-1-1"),
+    ("mito-tRNA-Ala-TGC-1-1-M_Ala.enriched.json", "mito-tRNA-Ala-UGC-1-1"),
+    ("tRNA-fMet-CAT-1-1-B_Met.enriched.json", "tRNA-fMet-CAU-1-1"),
+    # Plain .json suffix
+    ("tRNA-Ile2-CAT-1-1-B_Ile.json", "tRNA-Ile2-CAU-1-1"),
+]
+
+
+@pytest.mark.parametrize("filename,expected", FILENAME_CASES)
+def test_infer_trna_id_from_filename(filename, expected):
+    """Test tRNA ID inference from filenames."""
+    assert trnas_in_space.infer_trna_id_from_filename(filename) == expected
 
 
-def test_should_exclude_trna():
-    """Test SeC and mitochondrial tRNA filtering function."""
+# (trna_id, include_mito, expected) ground truth for should_exclude_trna()
+EXCLUDE_CASES = [
     # ======== Default mode: nuclear tRNA coordinates ========
-
     # Should exclude SeC tRNAs
-    assert trnas_in_space.should_exclude_trna("nuc-tRNA-SeC-TCA-1-1")
-    assert trnas_in_space.should_exclude_trna("tRNA-Sec-TCA-1-1")
-    assert trnas_in_space.should_exclude_trna("Selenocysteine-tRNA-1")
-    assert trnas_in_space.should_exclude_trna("SEC_tRNA")
-
+    ("nuc-tRNA-SeC-TCA-1-1", False, True),
+    ("tRNA-Sec-TCA-1-1", False, True),
+    ("Selenocysteine-tRNA-1", False, True),
+    ("SEC_tRNA", False, True),
     # Should exclude mitochondrial tRNAs (when generating nuclear coords)
-    assert trnas_in_space.should_exclude_trna("mito-tRNA-Ala-UGC")
-    assert trnas_in_space.should_exclude_trna("mito-tRNA-Leu-UAA")
-    assert trnas_in_space.should_exclude_trna("MITO-tRNA-Phe-GAA")
-
+    ("mito-tRNA-Ala-UGC", False, True),
+    ("mito-tRNA-Leu-UAA", False, True),
+    ("MITO-tRNA-Phe-GAA", False, True),
     # Should exclude initiator methionine tRNAs
-    assert trnas_in_space.should_exclude_trna("nuc-tRNA-iMet-CAT-1-1")
-    assert trnas_in_space.should_exclude_trna("tRNA-initiator-Met-CAU")
-
+    ("nuc-tRNA-iMet-CAT-1-1", False, True),
+    ("tRNA-initiator-Met-CAU", False, True),
+    ("tRNA-fMet-CAU", False, True),
     # Should not exclude standard nuclear elongator tRNAs
-    assert not trnas_in_space.should_exclude_trna("nuc-tRNA-Ala-GGC-1-1")
-    assert not trnas_in_space.should_exclude_trna("nuc-tRNA-Leu-CAA-1-1")
-    assert not trnas_in_space.should_exclude_trna("nuc-tRNA-Ser-GCT-1-1")
-    assert not trnas_in_space.should_exclude_trna("nuc-tRNA-Phe-GAA-1-1")
-
+    ("nuc-tRNA-Ala-GGC-1-1", False, False),
+    ("nuc-tRNA-Leu-CAA-1-1", False, False),
+    ("nuc-tRNA-Ser-GCT-1-1", False, False),
+    ("nuc-tRNA-Phe-GAA-1-1", False, False),
     # Handle edge cases
-    assert not trnas_in_space.should_exclude_trna(None)
-    assert not trnas_in_space.should_exclude_trna("")
-
+    (None, False, False),
+    ("", False, False),
     # ======== Mito mode: mitochondrial tRNA coordinates ========
-
     # With include_mito=True, should INCLUDE mitochondrial tRNAs
-    assert not trnas_in_space.should_exclude_trna("mito-tRNA-Ala-UGC", include_mito=True)
-    assert not trnas_in_space.should_exclude_trna("mito-tRNA-Leu-UAA", include_mito=True)
-
+    ("mito-tRNA-Ala-UGC", True, False),
+    ("mito-tRNA-Leu-UAA", True, False),
     # With include_mito=True, should EXCLUDE nuclear tRNAs
-    assert trnas_in_space.should_exclude_trna("nuc-tRNA-Ala-GGC-1-1", include_mito=True)
-    assert trnas_in_space.should_exclude_trna("nuc-tRNA-Leu-CAA-1-1", include_mito=True)
+    ("nuc-tRNA-Ala-GGC-1-1", True, True),
+    ("nuc-tRNA-Leu-CAA-1-1", True, True),
+]
+
+
+@pytest.mark.parametrize("trna_id,include_mito,expected", EXCLUDE_CASES)
+def test_should_exclude_trna(trna_id, include_mito, expected):
+    """Test SeC and mitochondrial tRNA filtering function."""
+    assert trnas_in_space.should_exclude_trna(trna_id, include_mito=include_mito) is expected
 
 
 def test_validate_no_global_index_collisions():
@@ -178,11 +378,21 @@ def test_validate_no_global_index_collisions():
         }
     )
 
-    # Should not raise any errors
-    try:
-        trnas_in_space.validate_no_global_index_collisions(good_df)
-    except SystemExit:
-        assert False, "Should not exit on good data"
+    # No collisions on good data
+    assert trnas_in_space.find_global_index_collisions(good_df).empty
+
+    # Same labels repeated across tRNAs (and unlabeled rows) are not collisions
+    shared_df = pd.DataFrame(
+        {
+            "global_index": [1, 2, 1, 2, 3],
+            "sprinzl_index": [1, 2, 1, 2, -1],
+            "sprinzl_label": ["1", "2", "1", "2", ""],
+            "trna_id": ["test1", "test1", "test2", "test2", "test2"],
+        }
+    )
+    assert trnas_in_space.find_global_index_collisions(shared_df).empty, (
+        "tRNAs sharing labels at a global_index are not collisions"
+    )
 
     # Create test DataFrame with collisions
     bad_df = pd.DataFrame(
@@ -194,17 +404,18 @@ def test_validate_no_global_index_collisions():
         }
     )
 
-    # Should exit with error
-    import pytest
+    # Both labelled rows at the shared index are reported
+    collisions = trnas_in_space.find_global_index_collisions(bad_df)
+    assert collisions["global_index"].tolist() == [2, 2]
+    assert sorted(collisions["pref_label"]) == ["47", "e1"]
 
+    # The pipeline-facing check reports them and exits with error
     with pytest.raises(SystemExit):
         trnas_in_space.validate_no_global_index_collisions(bad_df)
 
 
 def test_output_files_exist():
     """Test that expected output files exist in the outputs directory."""
-    outputs_dir = Path(__file__).parent / "outputs"
-
     # Check for expected output files
     expected_files = [
         "ecoliK12_global_coords.tsv",
@@ -212,23 +423,17 @@ def test_output_files_exist():
         "hg38_global_coords.tsv",
     ]
 
-    for filename in expected_files:
-        filepath = outputs_dir / filename
-        assert filepath.exists(), f"Expected output file not found: {filename}"
+    missing = sorted(set(expected_files).difference(OUTPUT_FILES))
+    assert not missing, f"Expected output files not found: {missing}"
 
 
-def test_output_file_structure():
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_output_file_structure(name, output_dfs):
     """Test that output TSV files have the correct structure."""
-    outputs_dir = Path(__file__).parent / "outputs"
-    test_file = outputs_dir / "ecoliK12_global_coords.tsv"
-
-    if not test_file.exists():
-        return  # Skip if file doesn't exist
-
-    # Read the TSV
-    df = pd.read_csv(test_file, sep="\t")
+    df = output_dfs[name]
 
-    # Check required columns
+    # Check required columns (header only; output_dfs holds OUTPUT_COLUMNS)
+    header = pd.read_csv(OUTPUT_FILES[name], sep="\t", nrows=0).columns
     expected_columns = [
         "trna_id",
         "source_file",
@@ -243,52 +448,42 @@ def test_output_file_structure():
     ]
 
     for col in expected_columns:
-        assert col in df.columns, f"Missing expected column: {col}"
+        assert col in header, f"Missing expected column: {col}"
 
     # Check data types and basic constraints
     assert df["seq_index"].dtype in [np.int64, np.int32], "seq_index should be integer"
     assert len(df) > 0, "Output file should not be empty"
-    assert df["trna_id"].notna().all(), "trna_id should not have NaN values"
-    assert df["residue"].notna().all(), "residue should not have NaN values"
-
-    # Check region values are valid
-    valid_regions = [
-        "acceptor-stem",
-        "acceptor-tail",
-        "D-stem",
-        "D-loop",
-        "anticodon-stem",
-        "anticodon-loop",
-        "variable-region",
-        "variable-arm",
-        "T-stem",
-        "T-loop",
-        "unknown",
-    ]
-    assert df["region"].isin(valid_regions).all(), "Invalid region values found"
-
-    print(f"✓ {test_file.name}: {len(df)} rows, {df['trna_id'].nunique()} unique tRNAs")
+    null_cols = df[["trna_id", "residue", "region"]].isna().any()
+    assert not null_cols.any(), f"NaN values in {null_cols[null_cols].index.tolist()}"
 
+    # Check region values are valid; region is categorical (and null-checked
+    # above), so its categories cover every row
+    invalid = set(df["region"].cat.categories).difference(VALID_REGIONS)
+    assert not invalid, f"Invalid region values found: {sorted(invalid)}"
 
-def test_global_index_continuity():
-    """Test that global_index values are properly continuous."""
-    outputs_dir = Path(__file__).parent / "outputs"
-    test_file = outputs_dir / "ecoliK12_global_coords.tsv"
+    logger.info("%s: %d rows, %d unique tRNAs", name, len(df), df["trna_id"].nunique())
 
-    if not test_file.exists():
-        return  # Skip if file doesn't exist
 
-    df = pd.read_csv(test_file, sep="\t")
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_global_index_continuity(name, output_dfs):
+    """Test that global_index values are properly continuous."""
+    df = output_dfs[name]
 
-    # Check that global_index starts at 1 and is continuous
-    global_indices = df["global_index"].dropna().unique()
-    global_indices.sort()
+    # Check that global_index starts at 1 (only the extremes are needed, so
+    # no unique/sort pass over the int32 values)
+    global_indices = df["global_index"].dropna().to_numpy(dtype=np.int32)
 
     assert len(global_indices) > 0, "Should have global indices"
-    assert global_indices[0] == 1, "Global index should start at 1"
+    assert global_indices.min() == 1, "Global index should start at 1"
 
     # Check for reasonable maximum (should be less than a few hundred for tRNAs)
-    assert global_indices[-1] < 500, "Global index seems unreasonably high"
+    assert global_indices.max() < 500, "Global index seems unreasonably high"
+
+    # Continuous: starting at 1, max distinct values means no gaps in 1..max
+    n_distinct = pd.unique(global_indices).size
+    assert n_distinct == global_indices.max(), (
+        f"Global index has gaps: {n_distinct} distinct values in 1..{global_indices.max()}"
+    )
 
 
 # ======================== Tests for unified coordinate system ========================
@@ -296,60 +491,51 @@ def test_global_index_continuity():
 
 def test_unified_files_exist():
     """Test that unified coordinate files exist for all organisms."""
-    outputs_dir = Path(__file__).parent / "outputs"
-
-    # Check for unified E. coli file
-    ecoli_file = outputs_dir / "ecoliK12_global_coords.tsv"
-    assert ecoli_file.exists(), f"Expected unified E. coli file: {ecoli_file}"
-
-    # Check for unified yeast file
-    yeast_file = outputs_dir / "sacCer_global_coords.tsv"
-    assert yeast_file.exists(), f"Expected unified yeast file: {yeast_file}"
-
-    # Check for unified human file
-    human_file = outputs_dir / "hg38_global_coords.tsv"
-    assert human_file.exists(), f"Expected unified human file: {human_file}"
+    expected_files = {
+        "E. coli": "ecoliK12_global_coords.tsv",
+        "yeast": "sacCer_global_coords.tsv",
+        "human": "hg38_global_coords.tsv",
+    }
+    missing = [
+        f"{organism}: {filename}"
+        for organism, filename in expected_files.items()
+        if filename not in OUTPUT_FILES
+    ]
+    assert not missing, f"Expected unified files not found: {missing}"
 
 
-def test_position_55_alignment_unified():
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_position_55_alignment_unified(name, output_dfs):
     """Test that position 55 aligns across all tRNAs in unified files."""
-    outputs_dir = Path(__file__).parent / "outputs"
-
-    for f in outputs_dir.glob("*_global_coords.tsv"):
-        if "offset" in f.name:
-            continue  # Skip any legacy files
-        df = pd.read_csv(f, sep="\t")
-        pos55 = df[df["sprinzl_label"] == "55"]
-
-        if len(pos55) < 2:
-            continue  # Skip files with too few pos55 entries
-
-        # All position 55 instances should have the same global_index
-        unique_gidx = pos55["global_index"].dropna().unique()
-        assert len(unique_gidx) == 1, (
-            f"Position 55 misalignment in {f.name}: "
-            f"found {len(unique_gidx)} different global_index values: {list(unique_gidx)}"
-        )
+    df = output_dfs[name]
+    # Only the global_index column of position 55 rows is needed
+    pos55 = df.loc[df["sprinzl_label"].eq("55"), "global_index"]
+
+    if len(pos55) < 2:
+        return  # Skip files with too few pos55 entries
+
+    # All position 55 instances should have the same global_index
+    unique_gidx = pos55.dropna().unique()
+    assert len(unique_gidx) == 1, (
+        f"Position 55 misalignment in {name}: "
+        f"found {len(unique_gidx)} different global_index values: {list(unique_gidx)}"
+    )
 
 
-def test_no_collisions_in_unified_files():
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_no_collisions_in_unified_files(name, output_dfs):
     """Test that unified files have no collisions."""
-    outputs_dir = Path(__file__).parent / "outputs"
+    df = output_dfs[name]
 
-    for f in outputs_dir.glob("*_global_coords.tsv"):
-        if "offset" in f.name:
-            continue  # Skip any legacy files
-        df = pd.read_csv(f, sep="\t")
-
-        # Check for collisions: multiple distinct sprinzl_labels at same global_index
-        for gidx, group in df.groupby("global_index"):
-            if pd.isna(gidx):
-                continue
-            labels = group["sprinzl_label"].dropna().unique()
-            labels = [lbl for lbl in labels if lbl != ""]
-            assert (
-                len(labels) <= 1
-            ), f"Collision in {f.name}: global_index {gidx} has multiple labels: {labels}"
+    # Check for collisions: multiple distinct sprinzl_labels at same global_index
+    labeled = df.loc[
+        df["sprinzl_label"].notna() & df["sprinzl_label"].ne("") & df["global_index"].notna()
+    ]
+    counts = labeled.groupby("global_index")["sprinzl_label"].nunique()
+    if (counts > 1).any():
+        gidx = counts.index[counts > 1][0]
+        labels = list(labeled.loc[labeled["global_index"] == gidx, "sprinzl_label"].unique())
+        assert False, f"Collision in {name}: global_index {gidx} has multiple labels: {labels}"
 
 
 # ======================== Tests for label/index consistency ========================
@@ -376,7 +562,12 @@ def test_label_index_consistency_within_trna():
     pass
 
 
-def test_no_label_index_mismatch_at_deletion_sites():
+# Purely numeric Sprinzl label (no insertion suffix), e.g. "21" but not "20a"
+DIGITS_RE = re.compile(r"\d+")
+
+
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_no_label_index_mismatch_at_deletion_sites(name, output_dfs):
     """
     Test for the specific pattern where a deletion causes label != index+offset.
 
@@ -390,37 +581,30 @@ def test_no_label_index_mismatch_at_deletion_sites():
     and we haven't implemented an automated fix yet. See:
     docs/R2DT_LABEL_INDEX_MISMATCH_BUG.md
     """
-    outputs_dir = Path(__file__).parent / "outputs"
     issues_found = []
-
-    for f in outputs_dir.glob("*_global_coords.tsv"):
-        if "offset" in f.name:
-            continue  # Skip any legacy files
-        df = pd.read_csv(f, sep="\t")
-
-        for trna_id, group in df.groupby("trna_id"):
-            group = group.sort_values("seq_index")
-            rows = group.to_dict("records")
-
-            for i in range(1, len(rows)):
-                prev_idx = rows[i - 1]["sprinzl_index"]
-                curr_idx = rows[i]["sprinzl_index"]
-                curr_label = str(rows[i]["sprinzl_label"]).strip()
-
-                # Check for deletion (gap in index sequence)
-                if prev_idx > 0 and curr_idx > 0 and curr_idx > prev_idx + 1:
-                    # There's a gap in the index sequence
-                    # If label is numeric, it should match the index (accounting for offset)
-                    if curr_label.isdigit():
-                        label_num = int(curr_label)
-                        # The label should be >= curr_idx (not filling the gap incorrectly)
-                        # Allow for consistent offset, but label shouldn't be in the skipped range
-                        skipped_positions = set(range(prev_idx + 1, curr_idx))
-                        if label_num in skipped_positions:
-                            issues_found.append(
-                                f"{f.name}: {trna_id} seq={rows[i]['seq_index']} "
-                                f"idx={curr_idx} label={curr_label} (skipped: {skipped_positions})"
-                            )
+    df = output_dfs[name]  # sorted by (trna_id, seq_index), see read_output_tables
+
+    # Compare each row with the previous row of the same tRNA in one pass
+    prev_idx = df.groupby("trna_id", sort=False)["sprinzl_index"].shift(1)
+    curr_idx = df["sprinzl_index"]
+    # Numeric value of purely numeric labels, parsed once per distinct label
+    # (sprinzl_label is categorical; code -1 for missing picks the trailing NaN)
+    cats = df["sprinzl_label"].cat.categories.astype(str).str.strip()
+    cat_num = pd.to_numeric(cats.where(cats.str.fullmatch(DIGITS_RE)), errors="coerce")
+    label_num = pd.Series(np.append(cat_num, np.nan)[df["sprinzl_label"].cat.codes], index=df.index)
+
+    # A deletion (gap in the index sequence) whose numeric label falls in
+    # the skipped range, i.e. the label fills the gap incorrectly. An integer
+    # label strictly between prev and curr already implies curr > prev + 1
+    # and curr > 0, so those comparisons are not spelled out.
+    mask = (prev_idx > 0) & (label_num > prev_idx) & (label_num < curr_idx)
+    labels = df["sprinzl_label"][mask].astype(str).str.strip()
+    for row, prev, label in zip(df.loc[mask].itertuples(), prev_idx[mask], labels):
+        skipped_positions = set(range(int(prev) + 1, row.sprinzl_index))
+        issues_found.append(
+            f"{name}: {row.trna_id} seq={row.seq_index} "
+            f"idx={row.sprinzl_index} label={label} (skipped: {skipped_positions})"
+        )
 
     # WARN-ONLY: Print issues but don't fail (known R2DT bug affecting ~64 tRNAs)
     if issues_found:
@@ -432,7 +616,57 @@ def test_no_label_index_mismatch_at_deletion_sites():
         print("  See docs/R2DT_LABEL_INDEX_MISMATCH_BUG.md for details\n")
 
 
-def test_global_index_preserves_seq_order():
+def seq_order_decreases(df):
+    """
+    Rows whose global_index is below that of the previous placed row of the
+    same tRNA, as (trna_id, prev_seq, curr_seq, prev_label, curr_label,
+    prev_global, curr_global) tuples with missing labels as "".
+
+    df must be sorted by (trna_id, seq_index), as output_dfs tables are (see
+    read_output_tables). Gap positions (null global_index) are skipped.
+    """
+    df = df[df["global_index"].notna()]
+
+    # Rows are sorted per tRNA, so the previous placed row is simply the row
+    # before; np.diff finds every decrease that stays within one tRNA
+    same_trna = np.diff(pd.factorize(df["trna_id"])[0]) == 0
+    curr = np.flatnonzero(same_trna & (np.diff(df["global_index"].to_numpy(dtype=np.int64)) < 0)) + 1
+    prev_rows, curr_rows = df.iloc[curr - 1], df.iloc[curr]
+
+    def label_strs(rows):
+        labels = rows["sprinzl_label"]
+        return labels.astype(object).where(labels.notna(), "").astype(str)
+
+    return list(zip(
+        curr_rows["trna_id"],
+        prev_rows["seq_index"].astype(int), curr_rows["seq_index"],
+        label_strs(prev_rows), label_strs(curr_rows),
+        prev_rows["global_index"], curr_rows["global_index"],
+    ))
+
+
+def test_seq_order_decreases():
+    """Test decrease detection on a small table sorted by (trna_id, seq_index)."""
+    df = pd.DataFrame({
+        "trna_id": ["a", "a", "a", "a", "b", "b", "c", "c"],
+        "seq_index": [1, 2, 3, 4, 1, 2, 1, 2],
+        "sprinzl_label": pd.Series(["1", "2", None, "3", "1", "2", "2", "1"], dtype="category"),
+        # a: the gap row (null) is skipped, so 3 follows 2; b starts lower than
+        # a ended, which is not a decrease; c goes backward
+        "global_index": pd.array([1, 2, None, 3, 1, 2, 5, 4], dtype="Int32"),
+    })
+    assert seq_order_decreases(df) == [("c", 1, 2, "2", "1", 5, 4)]
+
+    # An empty label at a decrease is reported as ""
+    df.loc[3, "global_index"] = 1
+    assert seq_order_decreases(df)[0] == ("a", 2, 4, "2", "3", 2, 1)
+    df["sprinzl_label"] = df["sprinzl_label"].cat.add_categories("").fillna("")
+    df.loc[3, "sprinzl_label"] = ""
+    assert seq_order_decreases(df)[0][4] == ""
+
+
+@pytest.mark.parametrize("name", NUCLEAR_FILES)
+def test_global_index_preserves_seq_order(name, output_dfs):
     """
     Test that global_index never reorders seq_index within a tRNA.
 
@@ -447,46 +681,21 @@ def test_global_index_preserves_seq_order():
     NOTE: Violations involving empty sprinzl_labels are reported as warnings
     rather than failures, as these are a known issue requiring separate handling.
     """
-    outputs_dir = Path(__file__).parent / "outputs"
     violations = []
     empty_label_violations = []
 
-    for f in outputs_dir.glob("*_global_coords_offset*.tsv"):
-        df = pd.read_csv(f, sep="\t")
-
-        for trna_id, group in df.groupby("trna_id"):
-            group = group.sort_values("seq_index")
-
-            prev_global = None
-            prev_seq = None
-            prev_label = None
-
-            for _, row in group.iterrows():
-                curr_seq = row["seq_index"]
-                curr_global = row["global_index"]
-                curr_label = str(row["sprinzl_label"]) if pd.notna(row["sprinzl_label"]) else ""
-
-                # Skip if current global_index is null (gap position)
-                if pd.isna(curr_global):
-                    continue
-
-                # If we have a previous non-null global_index, check ordering
-                if prev_global is not None:
-                    if curr_global < prev_global:
-                        msg = (
-                            f"{f.name}: {trna_id} seq {prev_seq}→{curr_seq} "
-                            f"label '{prev_label}'→'{curr_label}' "
-                            f"global {prev_global}→{curr_global} (decreased!)"
-                        )
-                        # Separate empty label issues from other violations
-                        if prev_label == "" or curr_label == "" or prev_label == "nan" or curr_label == "nan":
-                            empty_label_violations.append(msg)
-                        else:
-                            violations.append(msg)
-
-                prev_global = curr_global
-                prev_seq = curr_seq
-                prev_label = curr_label
+    rows = seq_order_decreases(output_dfs[name])
+    for trna_id, prev_seq, curr_seq, prev_label, curr_label, prev_global, curr_global in rows:
+        msg = (
+            f"{name}: {trna_id} seq {prev_seq}→{curr_seq} "
+            f"label '{prev_label}'→'{curr_label}' "
+            f"global {prev_global}→{curr_global} (decreased!)"
+        )
+        # Separate empty label issues from other violations
+        if prev_label == "" or curr_label == "" or prev_label == "nan" or curr_label == "nan":
+            empty_label_violations.append(msg)
+        else:
+            violations.append(msg)
 
     # Report empty label violations as warnings (known issue)
     if empty_label_violations:
@@ -509,7 +718,28 @@ def test_global_index_preserves_seq_order():
 # These tests use known biological invariants to verify coordinate accuracy
 
 
-def test_anticodon_matches_trna_name():
+# Anticodon part of a tRNA name: the part after the amino acid that follows
+# the first whole "tRNA" part. Format: nuc-tRNA-Ala-AGC-1-1 or tRNA-Ala-AGC-1-1
+TRNA_ANTICODON_RE = re.compile(r"(?:^|-)tRNA-[^-]*-([^-]*)")
+
+
+def residues_by_trna(df, labels):
+    """
+    Residues at the given sprinzl_labels, joined in label order, per tRNA.
+
+    Only tRNAs with exactly len(labels) such rows are returned, upper-cased
+    and in order of first appearance.
+    """
+    rows = df[df["sprinzl_label"].isin(labels)]
+    order = rows["trna_id"].unique()
+    rows = rows.sort_values("sprinzl_label", kind="stable")
+    grouped = rows["residue"].astype(str).groupby(rows["trna_id"], sort=False)
+    joined = grouped.agg("".join)[grouped.size() == len(labels)]
+    return joined.reindex(order).dropna().str.upper()
+
+
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_anticodon_matches_trna_name(name, output_dfs):
     """
     Verify positions 34-35-36 contain the anticodon from the tRNA name.
 
@@ -527,7 +757,6 @@ def test_anticodon_matches_trna_name():
     shifted R2DT labels are corrected by MITO_LABEL_OFFSET_CORRECTIONS in
     trnas_in_space.py.
     """
-    outputs_dir = Path(__file__).parent / "outputs"
     mismatches = []
 
     # Known R2DT annotation issues where anticodon in file doesn't match filename
@@ -536,53 +765,32 @@ def test_anticodon_matches_trna_name():
         "nuc-tRNA-Tyr-AUA-1-1",  # R2DT annotated anticodon as GGT, not ATA
     }
 
-    for f in outputs_dir.glob("*_global_coords.tsv"):
-        if "offset" in f.name:
-            continue  # Skip legacy files
-
-        df = pd.read_csv(f, sep="\t")
-
-        for trna_id in df["trna_id"].unique():
-            # Skip known R2DT annotation issues
-            if trna_id in known_r2dt_issues:
-                continue
+    df = output_dfs[name]
 
-            # Extract expected anticodon from tRNA name
-            # Format: nuc-tRNA-Ala-AGC-1-1 or tRNA-Ala-AGC-1-1
-            parts = trna_id.split("-")
-            if len(parts) < 4:
-                continue
+    # Actual anticodons for every tRNA with all three positions, T -> U
+    actual = residues_by_trna(df, ["34", "35", "36"]).str.replace("T", "U")
 
-            # Find the anticodon (3-letter code after amino acid)
-            expected_anticodon = None
-            for i, part in enumerate(parts):
-                if part == "tRNA" and i + 2 < len(parts):
-                    expected_anticodon = parts[i + 2]
-                    break
-
-            if not expected_anticodon or len(expected_anticodon) != 3:
-                continue
-
-            # Normalize T/U
-            expected_anticodon = expected_anticodon.upper().replace("T", "U")
-
-            # Get positions 34-35-36 from output
-            subset = df[(df["trna_id"] == trna_id) & (df["sprinzl_label"].isin(["34", "35", "36"]))]
-
-            if len(subset) != 3:
-                continue  # Skip if missing positions
-
-            # Sort by label and concatenate residues
-            subset = subset.sort_values("sprinzl_label")
-            actual_anticodon = "".join(subset["residue"].values).upper().replace("T", "U")
+    # Expected anticodon from tRNA name (see TRNA_ANTICODON_RE)
+    ids = actual.index.to_series()
+    expected = (
+        ids.str.extract(TRNA_ANTICODON_RE, expand=False)
+        .str.upper()
+        .str.replace("T", "U")
+    )
+    checked = (
+        ~ids.isin(known_r2dt_issues)  # Skip known R2DT annotation issues
+        & ids.str.count("-").ge(3)
+        & expected.str.len().eq(3)
+    )
 
-            if actual_anticodon != expected_anticodon:
-                mismatches.append({
-                    "file": f.name,
-                    "trna_id": trna_id,
-                    "expected": expected_anticodon,
-                    "actual": actual_anticodon,
-                })
+    bad = checked & expected.ne(actual)
+    for trna_id, exp, act in zip(ids[bad], expected[bad], actual[bad]):
+        mismatches.append({
+            "file": name,
+            "trna_id": trna_id,
+            "expected": exp,
+            "actual": act,
+        })
 
     # Report and fail if mismatches found
     if mismatches:
@@ -596,7 +804,8 @@ def test_anticodon_matches_trna_name():
         assert False, "\n".join(msg_lines)
 
 
-def test_tloop_contains_ttc():
+@pytest.mark.parametrize("name", UNIFIED_FILES)
+def test_tloop_contains_ttc(name, output_dfs):
     """
     Verify positions 54-55-56 contain T-T-C in most tRNAs.
 
@@ -611,49 +820,30 @@ def test_tloop_contains_ttc():
     NOTE: Mitochondrial tRNAs are excluded from this validation because their
     T-loops are NOT conserved - they show 14+ different patterns in human mito tRNAs.
     """
-    outputs_dir = Path(__file__).parent / "outputs"
     non_ttc_trnas = []
-    total_checked = 0
-
-    for f in outputs_dir.glob("*_global_coords.tsv"):
-        if "offset" in f.name:
-            continue  # Skip legacy files
-        if "mito" in f.name.lower():
-            continue  # Skip mito files - T-loop not conserved in mito tRNAs
 
-        df = pd.read_csv(f, sep="\t")
-
-        for trna_id in df["trna_id"].unique():
-            # Skip mitochondrial tRNAs - T-loop is NOT conserved in mito
-            if trnas_in_space.is_mitochondrial_trna(trna_id):
-                continue
-
-            # Get positions 54-55-56
-            subset = df[(df["trna_id"] == trna_id) & (df["sprinzl_label"].isin(["54", "55", "56"]))]
-
-            if len(subset) != 3:
-                continue  # Skip if missing positions
-
-            total_checked += 1
-
-            # Sort by label and get residues
-            subset = subset.sort_values("sprinzl_label")
-            tloop = "".join(subset["residue"].values).upper()
-
-            # Check for valid T-loop patterns:
-            # - TTC/UUC (canonical TψC)
-            # - TTT/UUU (common variant)
-            # - *TC patterns (CTC, ATC, GTC) - valid biological variants
-            valid_tloop = (
-                tloop in ("TTC", "UUC", "TTU", "UUU", "TTT") or
-                tloop.endswith("TC") or tloop.endswith("UC")
-            )
-            if not valid_tloop:
-                non_ttc_trnas.append({
-                    "file": f.name,
-                    "trna_id": trna_id,
-                    "tloop": tloop,
-                })
+    if "mito" in name.lower():
+        return  # Skip mito files - T-loop not conserved in mito tRNAs
+
+    df = output_dfs[name]
+    tloops = residues_by_trna(df, ["54", "55", "56"])
+    # Skip mitochondrial tRNAs - T-loop is NOT conserved in mito
+    tloops = tloops[~tloops.index.str.contains(trnas_in_space.MITO_ID_RE)]
+
+    # Check for valid T-loop patterns:
+    # - TTC/UUC (canonical TψC)
+    # - TTT/UUU (common variant)
+    # - *TC patterns (CTC, ATC, GTC) - valid biological variants
+    valid_tloop = (
+        tloops.isin(["TTC", "UUC", "TTU", "UUU", "TTT"])
+        | tloops.str.endswith("TC") | tloops.str.endswith("UC")
+    )
+    for trna_id, tloop in tloops[~valid_tloop].items():
+        non_ttc_trnas.append({
+            "file": name,
+            "trna_id": trna_id,
+            "tloop": tloop,
+        })
 
     # Strict check: ALL nuclear tRNAs must have valid T-loop sequence
     # Acceptable: TTC/UUC (canonical) or TTT/UUU (variant) or *TC patterns
@@ -666,59 +856,89 @@ def test_tloop_contains_ttc():
         assert False, "\n".join(msg_lines)
 
 
-# ======================== Deprecated Tests ========================
-# The following test references a file that no longer exists after unified system
-
-
-def run_basic_tests():
-    """Run all tests manually without pytest."""
-    tests = [
-        ("Imports", test_imports),
-        ("Sort key", test_sort_key),
-        ("Sprinzl numeric extraction", test_sprinzl_numeric_from_label),
-        ("Region assignment", test_assign_region_from_sprinzl),
-        ("Filename parsing", test_infer_trna_id_from_filename),
-        ("SeC filtering", test_should_exclude_trna),
-        ("Collision detection", test_validate_no_global_index_collisions),
-        ("Output files exist", test_output_files_exist),
-        ("Output file structure", test_output_file_structure),
-        ("Global index continuity", test_global_index_continuity),
-        # Unified coordinate system tests
-        ("Unified files exist", test_unified_files_exist),
-        ("Position 55 alignment (unified)", test_position_55_alignment_unified),
-        ("No collisions in unified files", test_no_collisions_in_unified_files),
-        # Biological validation tests
-        ("Anticodon matches tRNA name", test_anticodon_matches_trna_name),
-        ("T-loop contains TTC", test_tloop_contains_ttc),
-        # Label/index consistency tests
-        ("Label/index consistency", test_label_index_consistency_within_trna),
-        ("No mismatch at deletion sites", test_no_label_index_mismatch_at_deletion_sites),
-    ]
+# ======================== Visualization helper tests ========================
+# visualize_alignment_system needs the optional viz dependencies (matplotlib)
+
+
+@pytest.fixture(scope="session")
+def viz():
+    """The visualize_alignment_system module, skipping when matplotlib is missing."""
+    pytest.importorskip("matplotlib")
+    import visualize_alignment_system
+
+    return visualize_alignment_system
+
+
+def write_small_coords(path):
+    """Write a two-tRNA coordinate TSV and return it as load_data should read it."""
+    df = pd.DataFrame({
+        "trna_id": ["t1", "t1", "t2"],
+        "seq_index": [1, 2, 1],
+        "sprinzl_label": ["1", "", "e1"],
+        "residue": ["G", "C", "A"],
+        "global_index": [1, 2, 1],
+        "region": ["acceptor-stem"] * 3,
+    })
+    df.to_csv(path, sep="\t", index=False)
+    return df
+
+
+def test_load_data_ignores_corrupt_cache(viz, tmp_path):
+    """Test that an unreadable sidecar cache is reparsed from the TSV and replaced."""
+    tsv = tmp_path / "x_global_coords.tsv"
+    expected = write_small_coords(tsv)
+    cache = tsv.with_suffix(".parquet")
+    cache.write_bytes(b"not parquet")  # e.g. left by an interrupted write, newer than the TSV
+
+    df = viz.load_data(tsv)
+    assert df["trna_id"].astype(str).tolist() == expected["trna_id"].tolist()
+    assert df["sprinzl_label"].isna().tolist() == [False, True, False]
+
+    if importlib.util.find_spec("pyarrow") or importlib.util.find_spec("fastparquet"):
+        assert viz.load_data(tsv).equals(df), "cache should have been rewritten"
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_load_data_failed_cache_write_leaves_no_file(viz, tmp_path, monkeypatch):
+    """Test that a cache write failing midway leaves neither a cache nor a temp file."""
+    tsv = tmp_path / "x_global_coords.tsv"
+    write_small_coords(tsv)
+
+    def partial_write(self, path, **kwargs):
+        Path(path).write_bytes(b"PAR1 truncated")
+        raise OSError("disk full")
 
-    passed = 0
-    failed = 0
+    monkeypatch.setattr(pd.DataFrame, "to_parquet", partial_write)
+    viz.load_data(tsv)
+    assert sorted(p.name for p in tmp_path.iterdir()) == [tsv.name]
 
-    print("Running tests for trnas_in_space.py")
-    print("=" * 60)
 
-    for name, test_func in tests:
-        try:
-            test_func()
-            print(f"✓ {name}")
-            passed += 1
-        except AssertionError as e:
-            print(f"✗ {name}: {e}")
-            failed += 1
-        except Exception as e:
-            print(f"✗ {name}: Unexpected error: {e}")
-            failed += 1
+# (codes, resolution, expected); gap is code 0, nucleotides A/C/G/U are 1-4
+DOWNSAMPLE_CASES = [
+    ([[1, 2, 3]], 3, [[1, 2, 3]]),               # already fits: unchanged
+    ([[1, 2, 3]], 8, [[1, 2, 3]]),               # never upsampled
+    ([[1, 1, 2, 2]], 2, [[1, 2]]),               # blocks of 2
+    ([[1, 1, 2, 2, 3]], 2, [[1, 2]]),            # ceil step 3; short last block, 2/3 tie -> lower
+    ([[3, 2, 2, 3]], 1, [[2]]),                  # residue tie -> lowest code
+    ([[0, 3, 0, 4]], 2, [[3, 4]]),               # gap/residue tie -> residue
+    ([[0, 0, 1, 1]], 2, [[0, 1]]),               # all-gap block stays a gap
+    ([[0, 0, 2]], 1, [[0]]),                     # gap strict majority wins
+    ([[1, 0], [0, 0]], 1, [[1], [0]]),           # rows downsampled independently
+]
 
-    print("=" * 60)
-    print(f"Results: {passed} passed, {failed} failed")
 
-    return failed == 0
+@pytest.mark.parametrize("codes,resolution,expected", DOWNSAMPLE_CASES)
+def test_downsample_codes(viz, codes, resolution, expected):
+    """Test that downsample_codes keeps each block's majority code, preferring residues."""
+    codes = np.array(codes, dtype=np.uint8)
+    out = viz.downsample_codes(codes, resolution)
+    assert out.dtype == codes.dtype
+    assert out.shape == np.shape(expected)
+    assert out.shape[1] <= resolution
+    assert out.tolist() == expected
 
 
 if __name__ == "__main__":
-    success = run_basic_tests()
-    sys.exit(0 if success else 1)
+    # Same suite, fixtures and parametrization as `python -m pytest`; use
+    # `make test-parallel` to spread it across cores with pytest-xdist
+    sys.exit(pytest.main([__file__]))